@@ -106,9 +106,12 @@ import sys
 import pygame
 import os
 import math
-import copy
 import random
 import re
+import collections
+import functools
+import heapq
+import itertools
 # import time
 
 DEBUG_PROFILING = False
@@ -138,14 +141,26 @@ class Profiler:
 
     Attributes
     ----------
-    sections : dict[str, list[float]]
-        In which sections it runs
+    sections : dict[str, collections.deque[float]]
+        In which sections it runs, the current frame is at index 0
     """
     SHOW_LAST = 10
 
     def __init__(self):
         self.sections = {}
 
+        if not DEBUG_PROFILING:  # measuring is called from the main loop, make it cost next to nothing
+            self.measure_start = Profiler.do_nothing
+            self.measure_stop = Profiler.do_nothing
+            self.end_of_frame = Profiler.do_nothing
+
+    @staticmethod
+    def do_nothing(*args) -> None:
+        """
+        Replacement of measuring methods when profiling is off
+        """
+        pass
+
     def measure_start(self, section_name: str):
         """
         Start measuring, store into section
@@ -157,10 +172,11 @@ class Profiler:
         if not DEBUG_PROFILING:
             return
 
-        if section_name not in self.sections:
-            self.sections[section_name] = [0.0 for i in range(Profiler.SHOW_LAST)]
+        section_values = self.sections.get(section_name)
 
-        section_values = self.sections[section_name]
+        if section_values is None:
+            section_values = collections.deque([0.0] * Profiler.SHOW_LAST, maxlen=Profiler.SHOW_LAST)
+            self.sections[section_name] = section_values
 
         section_values[0] -= pygame.time.get_ticks()
 
@@ -175,10 +191,10 @@ class Profiler:
         if not DEBUG_PROFILING:
             return
 
-        if section_name not in self.sections:
-            return
+        section_values = self.sections.get(section_name)
 
-        section_values = self.sections[section_name]
+        if section_values is None:
+            return
 
         section_values[0] += pygame.time.get_ticks()
 
@@ -186,10 +202,11 @@ class Profiler:
         """
         Clear last frame in all sections
         """
-        for section_name in self.sections:
-            section_values = self.sections[section_name]
-            section_values.pop()
-            section_values.insert(0, 0)
+        if not DEBUG_PROFILING:
+            return
+
+        for section_values in self.sections.values():
+            section_values.appendleft(0)  # oldest value falls out at the other end
 
     def get_profile_string(self) -> str:
         """
@@ -209,13 +226,37 @@ class Profiler:
 
             section_values = self.sections[section_name]
 
-            for i in range(len(section_values)):
-                result += str(section_values[i]).ljust(5)
+            for value in section_values:
+                result += str(value).ljust(5)
 
             result += " AVG: " + str(sum(section_values) / float(len(section_values)))
 
         return result
 
+# ------------------------------------------------------------------------------
+
+def coordinate_pair(other) -> tuple:
+    """
+    Column and row of the other operand of Coordinate/Position comparison
+
+    Parameters
+    ----------
+    other : Coordinate or Position or tuple or list or float or int
+        scalar is used for both column and row
+
+    Return
+    ------
+    tuple
+    """
+    try:
+        return other.col, other.row
+    except AttributeError:
+        pass
+    try:
+        return other[0], other[1]
+    except TypeError:
+        return other, other
+
 # ==============================================================================
 
 
@@ -228,6 +269,8 @@ class Coordinate:
     row : float
     """
 
+    __slots__ = ('col', 'row')
+
     def __init__(self, col: float = 0.0, row: float = 0.0):
         self.col = col
         self.row = row
@@ -261,115 +304,81 @@ class Coordinate:
         return self.col, self.row
 
     def __add__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Coordinate(float(self.get_col() + other.get_col()), float(self.get_row() + other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Coordinate(float(self.get_col() + other[0]), float(self.get_row() + other[1]))
-        else:
-            return Coordinate(float(self.get_col() + other), float(self.get_row() + other))
+        try:
+            return Coordinate(float(self.col + other.col), float(self.row + other.row))
+        except AttributeError:
+            pass
+        try:
+            return Coordinate(float(self.col + other[0]), float(self.row + other[1]))
+        except TypeError:
+            return Coordinate(float(self.col + other), float(self.row + other))
 
     def __sub__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Coordinate(float(self.get_col() - other.get_col()), float(self.get_row() - other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Coordinate(float(self.get_col() - other[0]), float(self.get_row() - other[1]))
-        else:
-            return Coordinate(float(self.get_col() - other), float(self.get_row() - other))
+        try:
+            return Coordinate(float(self.col - other.col), float(self.row - other.row))
+        except AttributeError:
+            pass
+        try:
+            return Coordinate(float(self.col - other[0]), float(self.row - other[1]))
+        except TypeError:
+            return Coordinate(float(self.col - other), float(self.row - other))
 
     def __mul__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Coordinate(float(self.get_col() * other.get_col()), float(self.get_row() * other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Coordinate(float(self.get_col() * other[0]), float(self.get_row() * other[1]))
-        else:
-            return Coordinate(float(self.get_col() * other), float(self.get_row() * other))
+        try:
+            return Coordinate(float(self.col * other.col), float(self.row * other.row))
+        except AttributeError:
+            pass
+        try:
+            return Coordinate(float(self.col * other[0]), float(self.row * other[1]))
+        except TypeError:
+            return Coordinate(float(self.col * other), float(self.row * other))
 
     def __truediv__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Coordinate(float(self.get_col() / other.get_col()), float(self.get_row() / other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Coordinate(float(self.get_col() / other[0]), float(self.get_row() / other[1]))
-        else:
-            return Coordinate(float(self.get_col() / other), float(self.get_row() / other))
+        try:
+            return Coordinate(self.col / other.col, self.row / other.row)
+        except AttributeError:
+            pass
+        try:
+            return Coordinate(self.col / other[0], self.row / other[1])
+        except TypeError:
+            return Coordinate(self.col / other, self.row / other)
 
     def __eq__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() == other.get_col() and self.get_row() == other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() == other[0] and self.get_row() == other[1]
-        else:
-            return self.get_col() == other and self.get_row() == other
+        try:
+            return self.col == other.col and self.row == other.row
+        except AttributeError:
+            pass
+        try:
+            return self.col == other[0] and self.row == other[1]
+        except TypeError:
+            return self.col == other and self.row == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)  # direct, tile changes are checked every frame for every player
+
+    # comparisons are componentwise (a partial order), gt/lt just also require the positions to differ
 
     def __gt__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return (
-                self.get_col() > other.get_col()
-                and self.get_row() >= other.get_row()
-            ) or (
-                self.get_col() >= other.get_col()
-                and self.get_row() > other.get_row()
-            )
-        elif isinstance(other, (tuple, list)):
-            return (
-                self.get_col() > other[0]
-                and self.get_row() >= other[1]
-            ) or (
-                self.get_col() >= other[0]
-                and self.get_row() > other[1]
-            )
-        else:
-            return (
-                self.get_col() > other
-                and self.get_row() >= other
-            ) or (
-                self.get_col() >= other
-                and self.get_row() > other
-            )
+        col, row = coordinate_pair(other)
+        return self.col >= col and self.row >= row and (self.col != col or self.row != row)
 
     def __ge__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() >= other.get_col() and self.get_row() >= other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() >= other[0] and self.get_row() >= other[1]
-        else:
-            return self.get_col() >= other and self.get_row() >= other
+        col, row = coordinate_pair(other)
+        return self.col >= col and self.row >= row
 
     def __lt__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return (
-                self.get_col() < other.get_col()
-                and self.get_row() <= other.get_row()
-            ) or (
-                self.get_col() <= other.get_col()
-                and self.get_row() < other.get_row()
-            )
-        elif isinstance(other, (tuple, list)):
-            return (
-                self.get_col() < other[0]
-                and self.get_row() <= other[1]
-            ) or (
-                self.get_col() <= other[0]
-                and self.get_row() < other[1]
-            )
-        else:
-            return (
-                self.get_col() < other
-                and self.get_row() <= other
-            ) or (
-                self.get_col() <= other
-                and self.get_row() < other
-            )
+        col, row = coordinate_pair(other)
+        return self.col <= col and self.row <= row and (self.col != col or self.row != row)
 
     def __le__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() <= other.get_col() and self.get_row() <= other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() <= other[0] and self.get_row() <= other[1]
-        else:
-            return self.get_col() <= other and self.get_row() <= other
+        col, row = coordinate_pair(other)
+        return self.col <= col and self.row <= row
+
+    def clone(self):
+        return Coordinate(self.col, self.row)
 
     def __copy__(self):
-        return Coordinate(self.get_col(), self.get_row())
+        return self.clone()
 
     def __str__(self):
         return "c[%s,%s]" % (self.col, self.row)
@@ -379,6 +388,8 @@ class Coordinate:
 
 class Position:
     """
+    Immutable tile position. Positions on the map (and a small margin around it) are interned,
+    so asking for the same tile again returns the very same object instead of a new one.
 
     Attributes
     ----------
@@ -386,9 +397,39 @@ class Position:
     row : int
     """
 
-    def __init__(self, col: int = 0, row: int = 0):
-        self.col = col
-        self.row = row
+    __slots__ = ('col', 'row')
+
+    INTERNED = {}  ##< (col, row) -> Position, filled by intern_area()
+
+    def __new__(cls, col: int = 0, row: int = 0):
+        position = Position.INTERNED.get((col, row))
+
+        if position is None:
+            position = object.__new__(cls)
+            object.__setattr__(position, "col", col)
+            object.__setattr__(position, "row", row)
+
+        return position
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    @staticmethod
+    def intern_area(size, margin: int = 4) -> None:
+        """
+        Interns all positions of the area of given size, extended by margin on each side.
+
+        Parameters
+        ----------
+        size : Position
+        margin : int
+        """
+        if (size.col + margin - 1, size.row + margin - 1) in Position.INTERNED:
+            return  # already done
+
+        for col in range(-margin, size.col + margin):
+            for row in range(-margin, size.row + margin):
+                Position.INTERNED[(col, row)] = Position(col, row)
 
     def get_col(self) -> int:  # pos[0]
         return self.col
@@ -405,10 +446,9 @@ class Position:
         Return
         ------
         Position
+            new position, self stays untouched
         """
-        self.col, self.row = coordinates
-        self.col, self.row = int(self.col), int(self.row)
-        return self
+        return Position(int(coordinates[0]), int(coordinates[1]))
 
     def get_tuple(self) -> tuple:
         """
@@ -419,115 +459,86 @@ class Position:
         return self.col, self.row
 
     def __add__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Position(int(self.get_col() + other.get_col()), int(self.get_row() + other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Position(int(self.get_col() + other[0]), int(self.get_row() + other[1]))
-        else:
-            return Position(int(self.get_col() + other), int(self.get_row() + other))
+        try:
+            return Position(int(self.col + other.col), int(self.row + other.row))
+        except AttributeError:
+            pass
+        try:
+            return Position(int(self.col + other[0]), int(self.row + other[1]))
+        except TypeError:
+            return Position(int(self.col + other), int(self.row + other))
 
     def __sub__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Position(int(self.get_col() - other.get_col()), int(self.get_row() - other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Position(int(self.get_col() - other[0]), int(self.get_row() - other[1]))
-        else:
-            return Position(int(self.get_col() - other), int(self.get_row() - other))
+        try:
+            return Position(int(self.col - other.col), int(self.row - other.row))
+        except AttributeError:
+            pass
+        try:
+            return Position(int(self.col - other[0]), int(self.row - other[1]))
+        except TypeError:
+            return Position(int(self.col - other), int(self.row - other))
 
     def __mul__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Position(int(self.get_col() * other.get_col()), int(self.get_row() * other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Position(int(self.get_col() * other[0]), int(self.get_row() * other[1]))
-        else:
-            return Position(int(self.get_col() * other), int(self.get_row() * other))
+        try:
+            return Position(int(self.col * other.col), int(self.row * other.row))
+        except AttributeError:
+            pass
+        try:
+            return Position(int(self.col * other[0]), int(self.row * other[1]))
+        except TypeError:
+            return Position(int(self.col * other), int(self.row * other))
 
     def __truediv__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return Position(int(self.get_col() / other.get_col()), int(self.get_row() / other.get_row()))
-        elif isinstance(other, (tuple, list)):
-            return Position(int(self.get_col() / other[0]), int(self.get_row() / other[1]))
-        else:
-            return Position(int(self.get_col() / other), int(self.get_row() / other))
+        try:
+            return Position(int(self.col / other.col), int(self.row / other.row))
+        except AttributeError:
+            pass
+        try:
+            return Position(int(self.col / other[0]), int(self.row / other[1]))
+        except TypeError:
+            return Position(int(self.col / other), int(self.row / other))
 
     def __eq__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() == other.get_col() and self.get_row() == other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() == other[0] and self.get_row() == other[1]
-        else:
-            return self.get_col() == other and self.get_row() == other
+        if other is self:
+            return True  # interned
+        try:
+            return self.col == other.col and self.row == other.row
+        except AttributeError:
+            pass
+        try:
+            return self.col == other[0] and self.row == other[1]
+        except TypeError:
+            return self.col == other and self.row == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)  # direct, tile changes are checked every frame for every player
+
+    # comparisons are componentwise (a partial order), gt/lt just also require the positions to differ
 
     def __gt__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return (
-                self.get_col() > other.get_col()
-                and self.get_row() >= other.get_row()
-            ) or (
-                self.get_col() >= other.get_col()
-                and self.get_row() > other.get_row()
-            )
-        elif isinstance(other, (tuple, list)):
-            return (
-                self.get_col() > other[0]
-                and self.get_row() >= other[1]
-            ) or (
-                self.get_col() >= other[0]
-                and self.get_row() > other[1]
-            )
-        else:
-            return (
-                self.get_col() > other
-                and self.get_row() >= other
-            ) or (
-                self.get_col() >= other
-                and self.get_row() > other
-            )
+        col, row = coordinate_pair(other)
+        return self.col >= col and self.row >= row and (self.col != col or self.row != row)
 
     def __ge__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() >= other.get_col() and self.get_row() >= other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() >= other[0] and self.get_row() >= other[1]
-        else:
-            return self.get_col() >= other and self.get_row() >= other
+        col, row = coordinate_pair(other)
+        return self.col >= col and self.row >= row
 
     def __lt__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return (
-                self.get_col() < other.get_col()
-                and self.get_row() <= other.get_row()
-            ) or (
-                self.get_col() <= other.get_col()
-                and self.get_row() < other.get_row()
-            )
-        elif isinstance(other, (tuple, list)):
-            return (
-                self.get_col() < other[0]
-                and self.get_row() <= other[1]
-            ) or (
-                self.get_col() <= other[0]
-                and self.get_row() < other[1]
-            )
-        else:
-            return (
-                self.get_col() < other
-                and self.get_row() <= other
-            ) or (
-                self.get_col() <= other
-                and self.get_row() < other
-            )
+        col, row = coordinate_pair(other)
+        return self.col <= col and self.row <= row and (self.col != col or self.row != row)
 
     def __le__(self, other):
-        if isinstance(other, (Position, Coordinate)):
-            return self.get_col() <= other.get_col() and self.get_row() <= other.get_row()
-        elif isinstance(other, (tuple, list)):
-            return self.get_col() <= other[0] and self.get_row() <= other[1]
-        else:
-            return self.get_col() <= other and self.get_row() <= other
+        col, row = coordinate_pair(other)
+        return self.col <= col and self.row <= row
+
+    def __hash__(self):
+        return hash((self.col, self.row))  # same as for the tuple, which compares equal
+
+    def clone(self):
+        return self  # immutable
 
     def __copy__(self):
-        return Position(self.get_col(), self.get_row())
+        return self.clone()
 
     def __str__(self):
         return "p[%s,%s]" % (self.col, self.row)
@@ -544,6 +555,8 @@ class GameInfo:
     max_games : int
     """
 
+    __slots__ = ('game_number', 'max_games')
+
     def __init__(self, game_number: int = 0, max_games: int = 0):
         self.game_number = game_number
         self.max_games = max_games
@@ -566,6 +579,8 @@ class PlayerInfo:
     team_number : int
     """
 
+    __slots__ = ('player_number', 'team_number')
+
     def __init__(self, player_number: int = 0, team_number: int = 0):
         self.player_number = player_number  # [0]
         self.team_number = team_number  # [1]
@@ -592,13 +607,19 @@ class ColorInfo:
         blue channel
     alpha : int
         % of visibility
+    hex_string : str or None
+        cached result of to_hex()
     """
 
+    __slots__ = ('red', 'green', 'blue', 'alpha', 'hex_string')
+
     def __init__(self, red: int = 0, green: int = 0, blue: int = 0, alpha: int = 0):
-        self.red = min(max(red, 0), 255)
-        self.green = min(max(green, 0), 255)
-        self.blue = min(max(blue, 0), 255)
-        self.alpha = min(max(alpha, 0), 100)
+        # clamp without min()/max() calls, values are nearly always in range already
+        self.red = red if 0 <= red <= 255 else (0 if red < 0 else 255)
+        self.green = green if 0 <= green <= 255 else (0 if green < 0 else 255)
+        self.blue = blue if 0 <= blue <= 255 else (0 if blue < 0 else 255)
+        self.alpha = alpha if 0 <= alpha <= 100 else (0 if alpha < 0 else 100)
+        self.hex_string = None
 
     def from_tuple(self, coordinates: tuple):
         """
@@ -612,6 +633,7 @@ class ColorInfo:
         """
         self.red, self.green, self.blue, self.alpha = coordinates
         self.red, self.green, self.blue, self.alpha = int(self.red), int(self.green), int(self.blue), int(self.alpha)
+        self.hex_string = None
         return self
 
     def get_tuple(self) -> tuple:
@@ -628,7 +650,10 @@ class ColorInfo:
         ------
         str
         """
-        return "%02x%02x%02x" % (self.red, self.green, self.blue)
+        if self.hex_string is None:
+            self.hex_string = "%02x%02x%02x" % (self.red, self.green, self.blue)
+
+        return self.hex_string
 
     def from_hex(self, hexcode: str):
         """
@@ -641,9 +666,24 @@ class ColorInfo:
         ColorInfo
         """
 
-        self.red, self.green, self.blue = tuple(int(hexcode[i:i+2], 16) for i in (0, 2, 4))
+        self.red, self.green, self.blue = ColorInfo.parse_hex(hexcode)
+        self.hex_string = None
         return self
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def parse_hex(hexcode: str) -> tuple:
+        """
+        Parameters
+        ----------
+        hexcode : str
+
+        Return
+        ------
+        tuple[int, int, int]
+        """
+        return tuple(int(hexcode[i:i+2], 16) for i in (0, 2, 4))
+
     def __add__(self, other):
         if isinstance(other, ColorInfo):
             return ColorInfo(int(self.red + other.red), int(self.green + other.green), int(self.blue + other.blue))
@@ -677,6 +717,8 @@ class ColorInfo:
 
 class ColorInfoW(ColorInfo):
 
+    __slots__ = ()
+
     def whex(self):
         return "^#" + self.to_hex()
 
@@ -690,6 +732,9 @@ class MapTile:
     ----------
     kind : int
     flames : list[]
+        flames burning on the tile, change them through add_flame()/remove_flame()/burn_flames()
+    flame_count : int
+        number of flames on the tile
     coordinates : Position
     to_be_destroyed : bool
         Flag that marks the tile to be destroyed after the flames go out.
@@ -714,6 +759,8 @@ class MapTile:
     SPECIAL_OBJECT_ARROW_LEFT = 6
     SPECIAL_OBJECT_LAVA = 7
 
+    __slots__ = ('kind', 'flames', 'flame_count', 'coordinates', 'to_be_destroyed', 'item', 'special_object', 'destination_teleport')
+
     # ----------------------------------------------------------------------------
 
     def __init__(self, coordinates: Position):
@@ -725,15 +772,62 @@ class MapTile:
 
         self.kind = MapTile.TILE_FLOOR
         self.flames = []
+        self.flame_count = 0  ##< number of flames, walkability checks only need this
         self.coordinates = coordinates
         self.to_be_destroyed = False  ##< Flag that marks the tile to be destroyed after the flames go out.
         self.item = None  ##< Item that's present on the file
         self.special_object = None  ##< special object present on the tile, like trampoline or teleport
         self.destination_teleport = None  ##< in case of special_object equal to SPECIAL_OBJECT_TELEPORT_A or SPECIAL_OBJECT_TELEPORT_B holds the destionation teleport tile coordinates
 
+    def add_flame(self, flame) -> None:
+        """
+        Parameters
+        ----------
+        flame : Flame
+        """
+        self.flames.append(flame)
+        self.flame_count += 1
+
+    def remove_flame(self, flame) -> None:
+        """
+        Parameters
+        ----------
+        flame : Flame
+        """
+        self.flames.remove(flame)
+        self.flame_count -= 1
+
+    def burn_flames(self, dt: int) -> bool:
+        """
+        Lets the flames burn for given time and removes the burnt out ones in one pass.
+
+        Parameters
+        ----------
+        dt : int
+
+        Return
+        ------
+        bool
+            True if some flame burnt out
+        """
+        burnt_out = False
+
+        for flame in self.flames:
+            flame.time_to_burnout -= dt
+
+            if flame.time_to_burnout < 0:
+                burnt_out = True
+
+        if not burnt_out:
+            return False  # most frames nothing burns out, keep the list as it is
+
+        self.flames = [flame for flame in self.flames if flame.time_to_burnout >= 0]
+        self.flame_count = len(self.flames)
+        return True
+
     def should_not_walk(self) -> bool:
         return self.kind in [MapTile.TILE_WALL, MapTile.TILE_BLOCK] \
-               or len(self.flames) >= 1 \
+               or self.flame_count > 0 \
                or self.special_object == MapTile.SPECIAL_OBJECT_LAVA
 
 
@@ -752,18 +846,21 @@ class PlaySetup:
     """
     MAX_GAMES = 20
 
+    # default setup, player 0 vs 3 AI players; PlayerInfo is only ever replaced in slots, never changed, so it can be shared
+    DEFAULT_SLOTS = (
+        PlayerInfo(0, 0),
+        PlayerInfo(-1, 1),
+        PlayerInfo(-1, 2),
+        PlayerInfo(-1, 3),
+        None, None, None, None, None, None
+    )
+
     # ----------------------------------------------------------------------------
 
     def __init__(self):
-        self.player_slots = [None for i in range(10)]  ##< player slots: (player_number, team_color),
+        self.player_slots = list(PlaySetup.DEFAULT_SLOTS)  ##< player slots: (player_number, team_color),
         self.number_of_games = 10
 
-        # default setup, player 0 vs 3 AI players:
-        self.player_slots[0] = PlayerInfo(0, 0)
-        self.player_slots[1] = PlayerInfo(-1, 1)
-        self.player_slots[2] = PlayerInfo(-1, 2)
-        self.player_slots[3] = PlayerInfo(-1, 3)
-
     # ----------------------------------------------------------------------------
 
     def get_slots(self) -> list:
@@ -804,8 +901,13 @@ class GameMap:
 
     Attributes
     ----------
-    danger_map_is_up_to_date : bool
-        to regenerate danger map only when needed
+    danger_map_version : int
+        increased by every change affecting the danger map (bombs, flames, blocks), see get_danger_map_version(),
+        mere passing of time doesn't change it
+    danger_map_built_for : int
+        danger_map_version the danger map was last built for, to regenerate it only when needed
+    danger_base : list[list[int]] or None
+        danger map without any bombs (walls, blocks, flames, lava), None when it has to be recomputed
     tiles : list[list[MapTile]]
         position of each tile is defined as integer:integer (for that it has these lists)
         in testing it's 0-10 rows and 0-14 columns
@@ -828,13 +930,20 @@ class GameMap:
     number_of_blocks : int
         says how many block tiles there are currently on the map
     danger_map: list[list[int]]
+        danger values that don't change with time (walls, flames, safe tiles, bombs with detonator)
+    danger_explosion_times: list[list[int or float]]
+        map time at which the fire from timed bombs reaches each tile (math.inf if it doesn't)
+    danger_map_refresh_at : int or float
+        map time at which some bomb's detonator expires, the danger map has to be rebuilt then
     players : list[Player]
         list of players in the game
-    players_by_numbers : dict[int, Player or None]
-        mapping of numbers to players
+    players_by_numbers : list[Player or None]
+        player for each number, None for empty slots, see get_player()
     player_starting_items : list[int]
-    bombs : list[Bomb]
-        bombs on the map
+    bombs : dict[Bomb, int]
+        bombs on the map in the order they were laid, mapped to their serial number, see get_bombs()
+    bombs_laid : int
+        number of bombs ever added to the map, gives the serial numbers
     sound_events : list[int]
         list of currently happening sound event (see SoundPlayer class)
     animation_events : list[tuple[int, tuple[int, int]]]
@@ -846,6 +955,10 @@ class GameMap:
     """
 
     MAP_SIZE = Position(15, 11)
+    MAP_LAST_COL = MAP_SIZE.get_col() - 1  ##< plain int bounds for hot checks
+    MAP_LAST_ROW = MAP_SIZE.get_row() - 1
+    MAP_WIDTH = MAP_SIZE.get_col()  ##< row stride of tiles_flat
+    MAP_HEIGHT = MAP_SIZE.get_row()
     WALL_MARGIN_HORIZONTAL = 0.2
     WALL_MARGIN_VERTICAL = 0.4
 
@@ -869,6 +982,50 @@ class GameMap:
     ITEM_DETONATOR = 10
     ITEM_THROWING_GLOVE = 11
 
+    ITEM_LETTERS = {  ##< letters used for items in map encoding string
+        "f": ITEM_FLAME,
+        "F": ITEM_SUPERFLAME,
+        "b": ITEM_BOMB,
+        "k": ITEM_SHOE,
+        "s": ITEM_SPEEDUP,
+        "p": ITEM_SPRING,
+        "m": ITEM_MULTIBOMB,
+        "d": ITEM_DISEASE,
+        "r": ITEM_RANDOM,
+        "x": ITEM_BOXING_GLOVE,
+        "e": ITEM_DETONATOR,
+        "t": ITEM_THROWING_GLOVE
+    }
+
+    TILE_LETTERS = {  ##< tile characters in map encoding string -> (kind, special object), anything else is floor
+        "x": (MapTile.TILE_BLOCK, None),
+        "#": (MapTile.TILE_WALL, None),
+        "u": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_ARROW_UP),
+        "r": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_ARROW_RIGHT),
+        "d": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_ARROW_DOWN),
+        "l": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_ARROW_LEFT),
+        "U": (MapTile.TILE_BLOCK, MapTile.SPECIAL_OBJECT_ARROW_UP),
+        "R": (MapTile.TILE_BLOCK, MapTile.SPECIAL_OBJECT_ARROW_RIGHT),
+        "D": (MapTile.TILE_BLOCK, MapTile.SPECIAL_OBJECT_ARROW_DOWN),
+        "L": (MapTile.TILE_BLOCK, MapTile.SPECIAL_OBJECT_ARROW_LEFT),
+        "A": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_TELEPORT_A),
+        "B": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_TELEPORT_A),
+        "T": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_TRAMPOLINE),
+        "V": (MapTile.TILE_FLOOR, MapTile.SPECIAL_OBJECT_LAVA)
+    }
+    TILE_LETTER_DEFAULT = (MapTile.TILE_FLOOR, None)
+    MAP_WHITE_CHARACTERS = str.maketrans("", "", " \n")  ##< translation table removing white characters from map encoding string
+
+    FLAME_SPREAD_DIRECTIONS = (  ##< (col step, row step, flame direction, end flame direction) for each way of spreading
+        (0, -1, "vertical", "up"),
+        (1, 0, "horizontal", "right"),
+        (0, 1, "vertical", "down"),
+        (-1, 0, "horizontal", "left")
+    )
+
+    ROLLING_COLLISION_WINDOW = (0.5, 0.9)  ##< part of tile along the movement in which rolling bombs check collisions
+    ROLLING_COLLISION_WINDOW_BACKWARDS = (1 - ROLLING_COLLISION_WINDOW[1], 1 - ROLLING_COLLISION_WINDOW[0])
+
     SAFE_DANGER_VALUE = 5000  ##< time in ms, used in danger map to indicate safe tile
 
     GIVE_AWAY_DELAY = 3000  ##< after how many ms the items of dead players will be given away
@@ -895,16 +1052,23 @@ class GameMap:
         game_info : GameInfo
         all_items_cheat : bool, default=False
         """
-        # make the tiles array:
-        self.danger_map_is_up_to_date = False  # to regenerate danger map only when needed
-        self.tiles = []
-        self.starting_positions = [Coordinate() for i in range(10)]  # starting position for each player
+        Position.intern_area(GameMap.MAP_SIZE)  # tile positions get reused instead of allocated
 
-        map_data = map_data.replace(" ", "").replace("\n", "")  # get rid of white characters
+        # make the tiles array:
+        self.danger_map_version = 0  # increased on every change affecting the danger map
+        self.danger_map_built_for = -1  # to regenerate danger map only when needed
+        self.danger_base = None  # bomb-less part of danger map, changes only with flames and blocks
+        self.burning_tiles = {}  ##< row-major tile index -> tile with flames or a block to be destroyed, see add_burning_tile()
+        self.burning_tiles_queue = None  ##< heap of burning tile indices left to update in this frame, None outside update()
+        self.burning_tile_index = -1  ##< index of the burning tile being updated
+        self.tiles = [[None] * GameMap.MAP_WIDTH for i in range(GameMap.MAP_HEIGHT)]
+        self.starting_positions = [None] * 10  # starting position for each player, filled in while parsing
 
-        string_split = map_data.split(";")
+        # one pass to get rid of white characters, then the four sections of the map encoding string:
+        environment_name, start_items_string, items_string, tiles_string = \
+            map_data.translate(GameMap.MAP_WHITE_CHARACTERS).split(";", 3)
 
-        self.environment_name = string_split[0]
+        self.environment_name = environment_name
 
         self.end_game_at = -1  ##< time at which the map should go to STATE_GAME_OVER state
         self.start_game_at = GameMap.START_GAME_AFTER
@@ -921,99 +1085,79 @@ class GameMap:
 
         block_tiles = []
 
-        line = -1
-        column = 0
-
         teleport_a_tile = None  # helper variables used to pair teleports
         teleport_b_tile = None
         self.number_of_blocks = 0  ##< says how many block tiles there are currently on the map
 
-        for i in range(len(string_split[3])):
-            tile_character = string_split[3][i]
-
-            if i % GameMap.MAP_SIZE.get_col() == 0:  # add new row
-                line += 1
-                column = 0
-                self.tiles.append([])
+        map_width = GameMap.MAP_WIDTH
 
+        for i, tile_character in enumerate(tiles_string):
+            line, column = divmod(i, map_width)
             tile = MapTile(Position(column, line))
+            tile.kind, tile.special_object = GameMap.TILE_LETTERS.get(tile_character, GameMap.TILE_LETTER_DEFAULT)
 
             if tile_character == "x":
-                tile.kind = MapTile.TILE_BLOCK
                 block_tiles.append(tile)
-            elif tile_character == "#":
-                tile.kind = MapTile.TILE_WALL
-            elif tile_character in ("u", "r", "d", "l", "U", "R", "D", "L"):
-                if tile_character.islower():
-                    tile.kind = MapTile.TILE_FLOOR
+            elif tile_character == "A":
+                if teleport_a_tile is None:
+                    teleport_a_tile = tile
                 else:
-                    tile.kind = MapTile.TILE_BLOCK
-
-                tile_character = tile_character.lower()
-
-                if tile_character == "u":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_ARROW_UP
-                elif tile_character == "r":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_ARROW_RIGHT
-                elif tile_character == "d":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_ARROW_DOWN
+                    tile.destination_teleport = teleport_a_tile.coordinates
+                    teleport_a_tile.destination_teleport = tile.coordinates
+            elif tile_character == "B":
+                if teleport_b_tile is None:
+                    teleport_b_tile = tile
                 else:
-                    tile.special_object = MapTile.SPECIAL_OBJECT_ARROW_LEFT
-            else:
-                tile.kind = MapTile.TILE_FLOOR
-
-                if tile_character == "A":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_TELEPORT_A
-
-                    if teleport_a_tile is None:
-                        teleport_a_tile = tile
-                    else:
-                        tile.destination_teleport = teleport_a_tile.coordinates
-                        teleport_a_tile.destination_teleport = tile.coordinates
-                elif tile_character == "B":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_TELEPORT_A
-
-                    if teleport_b_tile is None:
-                        teleport_b_tile = tile
-                    else:
-                        tile.destination_teleport = teleport_b_tile.coordinates
-                        teleport_b_tile.destination_teleport = tile.coordinates
-                elif tile_character == "T":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_TRAMPOLINE
-                elif tile_character == "V":
-                    tile.special_object = MapTile.SPECIAL_OBJECT_LAVA
+                    tile.destination_teleport = teleport_b_tile.coordinates
+                    teleport_b_tile.destination_teleport = tile.coordinates
 
             if tile.kind == MapTile.TILE_BLOCK:
                 self.number_of_blocks += 1
 
-            self.tiles[-1].append(tile)
+            self.tiles[line][column] = tile
 
             if tile_character.isdigit():
                 self.starting_positions[int(tile_character)] = Coordinate(float(column), float(line))
 
-            column += 1
+        self.tiles_flat = [tile for tile_row in self.tiles for tile in tile_row]  ##< the same tiles row by row, one index per lookup
+        self.rolling_stopper_tiles = frozenset(  ##< (col, row) of walls and teleports, they never change during the game
+            (tile.coordinates.col, tile.coordinates.row) for tile in self.tiles_flat
+            if tile.kind == MapTile.TILE_WALL
+            or tile.special_object in (MapTile.SPECIAL_OBJECT_TELEPORT_A, MapTile.SPECIAL_OBJECT_TELEPORT_B)
+        )
+
+        self.starting_positions = [  # players missing in the map data start at the corner
+            Coordinate() if position is None else position for position in self.starting_positions
+        ]
 
         # place items under the block tiles:
 
-        for i in range(len(string_split[2])):
-            random_tile = random.choice(block_tiles)
-            random_tile.item = self.letter_to_item(string_split[2][i])
-            block_tiles.remove(random_tile)
+        for item_letter in items_string:
+            random_index = random.randrange(len(block_tiles))
+            block_tiles[random_index].item = self.letter_to_item(item_letter)
+            block_tiles[random_index] = block_tiles[-1]  # swap with the last one and pop, no list scanning
+            block_tiles.pop()
 
         # init danger map:
 
-        #  2D array of times in ms for each square that
-        danger_row = [GameMap.SAFE_DANGER_VALUE for i in range(GameMap.MAP_SIZE.get_col())]
-        self.danger_map = [danger_row for i in range(GameMap.MAP_SIZE.get_row())]
+        #  2D array of times in ms for each square that, every row is its own list
+        self.danger_map = [
+            [GameMap.SAFE_DANGER_VALUE] * GameMap.MAP_WIDTH for i in range(GameMap.MAP_HEIGHT)
+        ]
+        self.danger_explosion_times = [
+            [math.inf] * GameMap.MAP_WIDTH for i in range(GameMap.MAP_HEIGHT)
+        ]
+        self.danger_map_refresh_at = math.inf
 
         # initialise players:
 
         self.players = []  ##< list of players in the game
-        self.players_by_numbers = {}  ##< mapping of numbers to players
-        self.players_by_numbers[-1] = None
-
+        self.players_by_tile = {}  ##< (col, row) -> list of players standing on that tile, including dead and jumping ones
         player_slots = play_setup.get_slots()
 
+        self.players_by_numbers = [None] * len(player_slots)  ##< player for each number, None for empty slots
+        self.alive_players_by_team = {}  ##< team number -> how many of its players are alive, see player_died()
+
         for i in range(len(player_slots)):
             if player_slots[i] is not None:
                 new_player = Player()
@@ -1022,24 +1166,29 @@ class GameMap:
                 new_player.move_to_tile_center(self.starting_positions[i])
                 self.players.append(new_player)
                 self.players_by_numbers[i] = new_player
-            else:
-                self.players_by_numbers[i] = None
+                team_number = new_player.get_team_number()
+                self.alive_players_by_team[team_number] = self.alive_players_by_team.get(team_number, 0) + 1
+                new_player.game_map = self
+                self.update_player_tile(new_player)
 
         # give players starting items:
 
-        start_items_string = string_split[1] if not all_items_cheat else "bbbbbFkxtsssssmp"
+        if all_items_cheat:
+            start_items_string = "bbbbbFkxtsssssmp"
 
         self.player_starting_items = []
 
-        for i in range(len(start_items_string)):
-            for player in self.players:
-                item_to_give = self.letter_to_item(start_items_string[i])
+        for item_letter in start_items_string:
+            item_to_give = self.letter_to_item(item_letter)
 
+            for player in self.players:
                 player.give_item(item_to_give)
 
             self.player_starting_items.append(item_to_give)
 
-        self.bombs = []  ##< bombs on the map
+        self.bombs = {}  ##< bombs on the map -> serial number, a dict to remove exploded bombs in constant time
+        self.bombs_laid = 0
+        self.bombs_by_tile = {}  ##< (col, row) -> list of bombs lying or rolling on that tile, flying bombs are left out
         self.sound_events = []  ##< list of currently happening sound event (see SoundPlayer class)
         self.animation_events = []  ##< list of animation events, tuples in format (animation_event, coordinates)
         self.items_to_give_away = []  ##< list of tuples in format (time_of_giveaway, list_of_items)
@@ -1082,7 +1231,7 @@ class GameMap:
         ------
         MapTile
         """
-        return self.tiles[tile_coordinates.get_row()][tile_coordinates.get_col()]
+        return self.tiles_flat[tile_coordinates.row * GameMap.MAP_WIDTH + tile_coordinates.col]
 
     # ----------------------------------------------------------------------------
 
@@ -1114,14 +1263,31 @@ class GameMap:
         ------
         int
         """
-        if not self.danger_map_is_up_to_date:
+        if self.danger_map_built_for != self.danger_map_version or self.time_from_start >= self.danger_map_refresh_at:
             self.update_danger_map()
-            self.danger_map_is_up_to_date = True
+            self.danger_map_built_for = self.danger_map_version
+
+        col = tile_coordinates.col
+        row = tile_coordinates.row
 
-        if not self.tile_is_withing_map(tile_coordinates):
+        if not (0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW):
             return 0  # never walk outside map
 
-        return self.danger_map[tile_coordinates.get_row()][tile_coordinates.get_col()]
+        # timed bombs are stored as absolute times, so the map stays valid while the time passes
+        return min(self.danger_map[row][col], self.danger_explosion_times[row][col] - self.time_from_start)
+
+    # ----------------------------------------------------------------------------
+
+    def get_danger_map_version(self) -> int:
+        """
+        Version of the danger map, changes whenever danger values may have changed other than by the passing of
+        time (bomb timers count down without changing it), so callers can cache what they derive from them.
+
+        Return
+        ------
+        int
+        """
+        return self.danger_map_version
 
     # ----------------------------------------------------------------------------
 
@@ -1136,10 +1302,13 @@ class GameMap:
         ------
         bool
         """
-        if not self.tile_is_withing_map(tile_coordinates):
+        col = tile_coordinates.col
+        row = tile_coordinates.row
+
+        if not (0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW):
             return False
 
-        return self.get_tile(tile_coordinates).special_object == MapTile.SPECIAL_OBJECT_LAVA
+        return self.tiles_flat[row * GameMap.MAP_WIDTH + col].special_object == MapTile.SPECIAL_OBJECT_LAVA
 
     # ----------------------------------------------------------------------------
 
@@ -1157,48 +1326,77 @@ class GameMap:
     # ----------------------------------------------------------------------------
 
     def update_danger_map(self) -> None:
-        # reset the map:
-        self.danger_map = self._update_danger_entry()
+        # reset the map from the cached bomb-less base:
+        if self.danger_base is None:
+            self.danger_base = self._update_danger_entry()
+
+        self.danger_map = [danger_row[:] for danger_row in self.danger_base]
+        self.danger_explosion_times = [
+            [math.inf] * GameMap.MAP_WIDTH for i in range(GameMap.MAP_HEIGHT)
+        ]
+        self.danger_map_refresh_at = math.inf
 
         for bomb in self.bombs:
             bomb_tile = bomb.get_tile_position()
 
-            time_until_explosion = bomb.time_until_explosion()
-
             if bomb.has_detonator():  # detonator = bad
-                time_until_explosion = 100
-
-            self.danger_map[bomb_tile.get_row()][bomb_tile.get_col()] = min(self.danger_map[bomb_tile.get_row()][bomb_tile.get_col()], time_until_explosion)
+                self._flood_bomb_danger(self.danger_map, bomb_tile.col, bomb_tile.row, bomb.flame_length, 100)
 
-            # up                              right                            down                             left
-            position = [
-                Position(bomb_tile.get_col(), bomb_tile.get_row() - 1),
-                Position(bomb_tile.get_col() + 1, bomb_tile.get_row()),
-                Position(bomb_tile.get_col(), bomb_tile.get_row() + 1),
-                Position(bomb_tile.get_col() - 1, bomb_tile.get_row())
-            ]
-            flame_stop = [False, False, False, False]
-            tile_increment = [Position(0, -1), Position(1, 0), Position(0, 1), Position(-1, 0)]
-
-            for i in range(bomb.flame_length):
-                for direction in (0, 1, 2, 3):
-                    if flame_stop[direction]:
-                        continue
+                # after the detonator expires the bomb counts down as a timed one
+                self.danger_map_refresh_at = min(
+                    self.danger_map_refresh_at,
+                    self.time_from_start + Bomb.DETONATOR_EXPIRATION_TIME - bomb.time_of_existence
+                )
+            else:
+                self._flood_bomb_danger(self.danger_explosion_times, bomb_tile.col, bomb_tile.row, bomb.flame_length,
+                                        self.time_from_start + bomb.time_until_explosion())
+
+    def _flood_bomb_danger(self, danger_map: list, bomb_col: int, bomb_row: int, flame_length: int,
+                           time_until_explosion: int) -> None:
+        # marks tiles of given map reached by one bomb's flame, works on plain ints only
+        tiles = self.tiles_flat
+        width = GameMap.MAP_WIDTH
+        bombs_by_tile = self.bombs_by_tile
+        last_col = GameMap.MAP_LAST_COL
+        last_row = GameMap.MAP_LAST_ROW
+
+        if danger_map[bomb_row][bomb_col] > time_until_explosion:
+            danger_map[bomb_row][bomb_col] = time_until_explosion
+
+        # walk the flame in each direction until something stops it
+        for col_step, row_step in ((0, -1), (1, 0), (0, 1), (-1, 0)):  # up, right, down, left
+            col = bomb_col
+            row = bomb_row
+
+            for i in range(flame_length):
+                col += col_step
+                row += row_step
+
+                if not (0 <= col <= last_col and 0 <= row <= last_row):
+                    break
 
-                    if not self.tile_is_walkable(position[direction]) or not self.tile_is_withing_map(position[direction]):
-                        flame_stop[direction] = True
-                        continue
+                tile = tiles[row * width + col]
 
-                    current_tile = position[direction]
+                # inlined tile_is_walkable()
+                if not (tile.kind == MapTile.TILE_FLOOR or tile.to_be_destroyed) or (col, row) in bombs_by_tile:
+                    break
 
-                    self.danger_map[current_tile.get_row()][current_tile.get_col()] = min(self.danger_map[current_tile.get_row()][current_tile.get_col()], time_until_explosion)
-                    position[direction] += tile_increment[direction]
+                if danger_map[row][col] > time_until_explosion:
+                    danger_map[row][col] = time_until_explosion
 
     def _update_danger_entry(self) -> list:
-        allow = []
-        for tile_row in self.tiles:
-            allow.append(list(map(lambda tile: 0 if tile.should_not_walk() else GameMap.SAFE_DANGER_VALUE, tile_row)))
-        return allow
+        # whole board in one pass, MapTile.should_not_walk() inlined
+        not_walkable_kinds = (MapTile.TILE_WALL, MapTile.TILE_BLOCK)
+        lava = MapTile.SPECIAL_OBJECT_LAVA
+        safe = GameMap.SAFE_DANGER_VALUE
+
+        return [
+            [
+                0 if tile.kind in not_walkable_kinds or tile.flame_count or tile.special_object == lava else safe
+                for tile in tile_row
+            ]
+            for tile_row in self.tiles
+        ]
 
     # ----------------------------------------------------------------------------
 
@@ -1230,8 +1428,11 @@ class GameMap:
         ------
         MapTile or None
         """
-        if self.tile_is_withing_map(tile_coordinates):
-            return self.tiles[tile_coordinates.get_row()][tile_coordinates.get_col()]
+        col = tile_coordinates.col
+        row = tile_coordinates.row
+
+        if 0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW:
+            return self.tiles_flat[row * GameMap.MAP_WIDTH + col]
 
         return None
 
@@ -1276,22 +1477,7 @@ class GameMap:
         ----------
         int
         """
-        mapping = {
-            "f": GameMap.ITEM_FLAME,
-            "F": GameMap.ITEM_SUPERFLAME,
-            "b": GameMap.ITEM_BOMB,
-            "k": GameMap.ITEM_SHOE,
-            "s": GameMap.ITEM_SPEEDUP,
-            "p": GameMap.ITEM_SPRING,
-            "m": GameMap.ITEM_MULTIBOMB,
-            "d": GameMap.ITEM_DISEASE,
-            "r": GameMap.ITEM_RANDOM,
-            "x": GameMap.ITEM_BOXING_GLOVE,
-            "e": GameMap.ITEM_DETONATOR,
-            "t": GameMap.ITEM_THROWING_GLOVE
-        }
-
-        return mapping[letter] if letter in mapping else -1
+        return GameMap.ITEM_LETTERS.get(letter, -1)
 
     # ----------------------------------------------------------------------------
 
@@ -1306,12 +1492,12 @@ class GameMap:
         ------
         bool
         """
-        tile_coordinates = Positionable.position_to_tile(tile_coordinates)
+        col, row = Positionable.position_to_tile_tuple(tile_coordinates)
 
-        if not self.tile_is_withing_map(tile_coordinates):
+        if not (0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW):
             return False  # coordinates outside the map
 
-        return len(self.get_tile(tile_coordinates).flames) >= 1
+        return self.tiles_flat[row * GameMap.MAP_WIDTH + col].flame_count > 0
 
     # ----------------------------------------------------------------------------
 
@@ -1326,12 +1512,12 @@ class GameMap:
         ------
         bool
         """
-        tile_coordinates = Positionable.position_to_tile(tile_coordinates)
+        col, row = Positionable.position_to_tile_tuple(tile_coordinates)
 
-        if not self.tile_is_withing_map(tile_coordinates):
+        if not (0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW):
             return False  # coordinates outside the map
 
-        return self.get_tile(tile_coordinates).special_object in (MapTile.SPECIAL_OBJECT_TELEPORT_A, MapTile.SPECIAL_OBJECT_TELEPORT_B)
+        return self.tiles_flat[row * GameMap.MAP_WIDTH + col].special_object in (MapTile.SPECIAL_OBJECT_TELEPORT_A, MapTile.SPECIAL_OBJECT_TELEPORT_B)
 
     # ----------------------------------------------------------------------------
 
@@ -1346,12 +1532,13 @@ class GameMap:
         ------
         Bomb or None
         """
-        bombs = self.bombs_on_tile(tile_coordinates)
+        bombs = self.bombs_by_tile.get(Positionable.position_to_tile_tuple(tile_coordinates))
 
-        if len(bombs) > 0:
-            return bombs[0]
+        if bombs is None:
+            return None
 
-        return None
+        # the earliest laid one, like bombs_on_tile()[0] but without copying and sorting the list
+        return bombs[0] if len(bombs) == 1 else min(bombs, key=self.bombs.get)
 
     # ----------------------------------------------------------------------------
 
@@ -1367,7 +1554,7 @@ class GameMap:
         ------
         bool
         """
-        return self.bomb_on_tile(tile_coordinates) is not None
+        return Positionable.position_to_tile_tuple(tile_coordinates) in self.bombs_by_tile  # empty lists are dropped
 
     # ----------------------------------------------------------------------------
 
@@ -1382,20 +1569,55 @@ class GameMap:
         ------
         list[Player]
         """
-        result = []
-
-        for player in self.players:
-            player_tile_position = player.get_tile_position()
+        result = [
+            player for player in self.players_by_tile.get((tile_coordinates.col, tile_coordinates.row), ())
+            if player.is_on_ground()
+        ]
 
-            if not player.is_dead() \
-                    and not player.is_in_air() \
-                    and player_tile_position == tile_coordinates:
-                result.append(player)
+        if len(result) > 1:
+            result.sort(key=self.players.index)  # same order as the players list
 
         return result
 
     # ----------------------------------------------------------------------------
 
+    def update_player_tile(self, player) -> None:
+        """
+        Keeps the players_by_tile index in sync after given player's position changed.
+
+        Parameters
+        ----------
+        player : Player
+        """
+        tile = player.get_tile_position().get_tuple()  # also warms the tile cache
+
+        if tile == player.indexed_tile:
+            return
+
+        if player.indexed_tile is not None:
+            players = self.players_by_tile[player.indexed_tile]
+            players.remove(player)
+
+            if len(players) == 0:
+                del self.players_by_tile[player.indexed_tile]
+
+        player.indexed_tile = tile
+        self.players_by_tile.setdefault(tile, []).append(player)
+
+    # ----------------------------------------------------------------------------
+
+    def player_died(self, player) -> None:
+        """
+        Keeps the alive players count of given player's team in sync, called once when the player dies.
+
+        Parameters
+        ----------
+        player : Player
+        """
+        self.alive_players_by_team[player.get_team_number()] -= 1
+
+    # ----------------------------------------------------------------------------
+
     def tile_has_player(self, tile_coordinates: Position) -> int:
         """
 
@@ -1407,7 +1629,11 @@ class GameMap:
         ------
         int
         """
-        return len(self.get_players_at_tile(tile_coordinates))
+        # counted straight from the tile index, no need to build and sort the list get_players_at_tile() returns
+        return sum(
+            1 for player in self.players_by_tile.get((tile_coordinates.col, tile_coordinates.row), ())
+            if player.is_on_ground()
+        )
 
     # ----------------------------------------------------------------------------
 
@@ -1423,7 +1649,7 @@ class GameMap:
         ------
         bool
         """
-        return (0, 0) <= tile_coordinates <= (GameMap.MAP_SIZE - 1)
+        return 0 <= tile_coordinates.col <= GameMap.MAP_LAST_COL and 0 <= tile_coordinates.row <= GameMap.MAP_LAST_ROW
 
     # ----------------------------------------------------------------------------
 
@@ -1438,13 +1664,66 @@ class GameMap:
         ------
         bool
         """
-        if not self.tile_is_withing_map(tile_coordinates):
+        return self._walkable_at(tile_coordinates.col, tile_coordinates.row)
+
+    # ----------------------------------------------------------------------------
+
+    def _walkable_at(self, col: int, row: int) -> bool:
+        """
+        Same as tile_is_walkable(), but on plain int coordinates, so hot loops don't need to build positions.
+
+        Parameters
+        ----------
+        col : int
+        row : int
+
+        Return
+        ------
+        bool
+        """
+        if not (0 <= col <= GameMap.MAP_LAST_COL and 0 <= row <= GameMap.MAP_LAST_ROW):
             return False
 
-        tile = self.get_tile(tile_coordinates)
-        return self.tile_is_withing_map(tile_coordinates) \
-            and (tile.kind == MapTile.TILE_FLOOR or tile.to_be_destroyed) \
-            and not self.tile_has_bomb(tile_coordinates)
+        tile = self.tiles_flat[row * GameMap.MAP_WIDTH + col]
+        return (tile.kind == MapTile.TILE_FLOOR or tile.to_be_destroyed) \
+            and (col, row) not in self.bombs_by_tile
+
+    # ----------------------------------------------------------------------------
+
+    def count_free_tiles_in_line(self, start_tile: Position, direction: Position, limit: int) -> int:
+        """
+        Counts walkable tiles without players following start_tile in given direction, stops at the first
+        occupied one or at the limit.
+
+        Parameters
+        ----------
+        start_tile : Position
+        direction : Position
+            unit vector of the line
+        limit : int
+
+        Return
+        ------
+        int
+        """
+        col, row = start_tile.col, start_tile.row
+        col_step, row_step = direction.col, direction.row
+        players_by_tile = self.players_by_tile
+        count = 0
+
+        while count < limit:
+            col += col_step
+            row += row_step
+
+            if not self._walkable_at(col, row):
+                break
+
+            if any(player.is_on_ground() for player in players_by_tile.get((col, row), ())):
+                break
+
+            count += 1
+
+        return count
 
     # ----------------------------------------------------------------------------
 
@@ -1460,25 +1739,29 @@ class GameMap:
         ----------
         int
         """
-        tile_coordinates = Positionable.position_to_tile(position)
+        col = position.col
+        row = position.row
+        tile_col = math.floor(col)  # inlined Positionable.position_to_tile(), no Position needed here
+        tile_row = math.floor(row)
 
-        if not self.tile_is_walkable(tile_coordinates):
+        if not self._walkable_at(tile_col, tile_row):
             return GameMap.COLLISION_TOTAL
 
-        position_within_tile = (position.get_col() % 1, position.get_row() % 1)
+        col_within_tile = col - tile_col  # same as col % 1, the tile is already known
+        row_within_tile = row - tile_row
 
-        if position_within_tile[1] < GameMap.WALL_MARGIN_HORIZONTAL:
-            if not self.tile_is_walkable(Position(tile_coordinates.get_col(), tile_coordinates.get_row() - 1)):
+        if row_within_tile < GameMap.WALL_MARGIN_HORIZONTAL:
+            if not self._walkable_at(tile_col, tile_row - 1):
                 return GameMap.COLLISION_BORDER_UP
-        elif position_within_tile[1] > 1.0 - GameMap.WALL_MARGIN_HORIZONTAL:
-            if not self.tile_is_walkable(Position(tile_coordinates.get_col(), tile_coordinates.get_row() + 1)):
+        elif row_within_tile > 1.0 - GameMap.WALL_MARGIN_HORIZONTAL:
+            if not self._walkable_at(tile_col, tile_row + 1):
                 return GameMap.COLLISION_BORDER_DOWN
 
-        if position_within_tile[0] < GameMap.WALL_MARGIN_VERTICAL:
-            if not self.tile_is_walkable(Position(tile_coordinates.get_col() - 1, tile_coordinates.get_row())):
+        if col_within_tile < GameMap.WALL_MARGIN_VERTICAL:
+            if not self._walkable_at(tile_col - 1, tile_row):
                 return GameMap.COLLISION_BORDER_LEFT
-        elif position_within_tile[0] > 1.0 - GameMap.WALL_MARGIN_VERTICAL:
-            if not self.tile_is_walkable(Position(tile_coordinates.get_col() + 1, tile_coordinates.get_row())):
+        elif col_within_tile > 1.0 - GameMap.WALL_MARGIN_VERTICAL:
+            if not self._walkable_at(tile_col + 1, tile_row):
                 return GameMap.COLLISION_BORDER_RIGHT
 
         return GameMap.COLLISION_NONE
@@ -1496,18 +1779,47 @@ class GameMap:
         ------
         list[Bomb]
         """
-        result = []
+        result = list(self.bombs_by_tile.get(Positionable.position_to_tile_tuple(tile_coordinates), ()))
 
-        tile_coordinates = Positionable.position_to_tile(tile_coordinates)
+        if len(result) > 1:
+            result.sort(key=self.bombs.get)  # keep the order in which the bombs were laid
 
-        for bomb in self.bombs:
-            bomb_tile_position = bomb.get_tile_position()
+        return result
 
-            if bomb.movement != Bomb.BOMB_FLYING \
-                    and bomb_tile_position == tile_coordinates:
-                result.append(bomb)
+    # ----------------------------------------------------------------------------
 
-        return result
+    def update_bomb_tile(self, bomb) -> None:
+        """
+        Keeps the bombs_by_tile index in sync after given bomb was added, removed, moved or its movement changed.
+
+        Parameters
+        ----------
+        bomb : Bomb
+        """
+        if bomb.game_map is not self:
+            tile = None
+        elif bomb.movement == Bomb.BOMB_FLYING:
+            tile = None
+            self.danger_map_version += 1  # not indexed, but the danger map still counts with the flight's target tile
+        else:
+            tile = bomb.get_tile_position().get_tuple()
+
+        if tile == bomb.indexed_tile:
+            return  # e.g. a bomb rolling within its tile, nothing changes for the index or the danger map
+
+        self.danger_map_version += 1
+
+        if bomb.indexed_tile is not None:
+            bombs = self.bombs_by_tile[bomb.indexed_tile]
+            bombs.remove(bomb)
+
+            if len(bombs) == 0:
+                del self.bombs_by_tile[bomb.indexed_tile]
+
+        bomb.indexed_tile = tile
+
+        if tile is not None:
+            self.bombs_by_tile.setdefault(tile, []).append(bomb)
 
     # ----------------------------------------------------------------------------
 
@@ -1532,7 +1844,12 @@ class GameMap:
         ----------
         bomb: Bomb
         """
+        if not bomb.explodes():
+            return  # already exploded, no second round of flames
+
         self.add_sound_event(SoundPlayer.SOUND_EVENT_EXPLOSION)
+        self.danger_map_version += 1
+        self.danger_base = None  # new flames
 
         bomb_position = bomb.get_tile_position()
 
@@ -1540,94 +1857,93 @@ class GameMap:
         new_flame.player = bomb.player
         new_flame.direction = "all"
 
-        self.get_tile(bomb_position).flames.append(new_flame)
+        self.get_tile(bomb_position).add_flame(new_flame)
+        self.add_burning_tile(self.get_tile(bomb_position))
 
-        # information relevant to flame spreading in each direction:
+        # spread the flame in all 4 directions on plain ints, the last flame in each direction gets the end sprite:
 
-        # up                    right                down                 left
-        axis_position = [
-            bomb_position.get_row() - 1,
-            bomb_position.get_col() + 1,
-            bomb_position.get_row() + 1,
-            bomb_position.get_col() - 1
-        ]
-        flame_stop = [False, False, False, False]
-        map_limit = [0, GameMap.MAP_SIZE.get_col() - 1, GameMap.MAP_SIZE.get_row() - 1, 0]
-        increment = [-1, 1, 1, -1]
-        goes_horizontally = [False, True, False, True]
-        previous_flame = [None, None, None, None]
-
-        # spread the flame in all 4 directions:
-
-        for i in range(bomb.flame_length + 1):
-            if i >= bomb.flame_length:
-                flame_stop = [True, True, True, True]
-
-            for direction in (0, 1, 2, 3):  # for each direction
-                if flame_stop[direction]:
-                    if previous_flame[direction] is not None:  # flame stopped in previous iteration
-                        previous_flame[direction].direction = {0: "up", 1: "right", 2: "down", 3: "left"}[direction]
-                        previous_flame[direction] = None
-                else:
-                    if ((increment[direction] == -1 and axis_position[direction] >= map_limit[direction]) or
-                            (increment[direction] == 1 and axis_position[direction] <= map_limit[direction])):
-                        # flame is inside the map here
+        tiles = self.tiles_flat
+        width = GameMap.MAP_WIDTH
+        last_col = GameMap.MAP_LAST_COL
+        last_row = GameMap.MAP_LAST_ROW
 
-                        if goes_horizontally[direction]:
-                            tile_for_flame = self.get_tile(Position(axis_position[direction], bomb_position.get_row()))
-                        else:
-                            tile_for_flame = self.get_tile(Position(bomb_position.get_col(), axis_position[direction]))
+        for col_step, row_step, flame_direction, end_direction in GameMap.FLAME_SPREAD_DIRECTIONS:
+            col = bomb_position.col
+            row = bomb_position.row
+            last_flame = None
 
-                        if tile_for_flame.kind == MapTile.TILE_WALL:
-                            flame_stop[direction] = True
-                        else:
-                            new_flame2 = copy.copy(new_flame)
-                            new_flame2.direction = "horizontal" if goes_horizontally[direction] else "vertical"
-                            tile_for_flame.flames.append(new_flame2)
+            for i in range(bomb.flame_length):
+                col += col_step
+                row += row_step
 
-                            previous_flame[direction] = new_flame2
+                if not (0 <= col <= last_col and 0 <= row <= last_row):
+                    break
 
-                            if tile_for_flame.kind == MapTile.TILE_BLOCK:
-                                flame_stop[direction] = True
-                    else:
-                        flame_stop[direction] = True
+                tile_for_flame = tiles[row * width + col]
+
+                if tile_for_flame.kind == MapTile.TILE_WALL:
+                    break
+
+                last_flame = new_flame.clone()
+                last_flame.direction = flame_direction
+                tile_for_flame.add_flame(last_flame)
+                self.add_burning_tile(tile_for_flame)
 
-                axis_position[direction] += increment[direction]
+                if tile_for_flame.kind == MapTile.TILE_BLOCK:
+                    break
 
-        bomb.explodes()
+            if last_flame is not None:
+                last_flame.direction = end_direction
 
-        if bomb in self.bombs:
-            self.bombs.remove(bomb)
+        self.remove_bomb(bomb)
 
     # ----------------------------------------------------------------------------
 
-    def spread_items(self, items: list) -> None:
+    def add_burning_tile(self, tile: MapTile) -> None:
         """
+        Registers a tile that has just got a flame, update() then keeps updating it until its flames burn out and
+        its block (if any) is destroyed.
 
         Parameters
         ----------
-        items : list[int]
+        tile : MapTile
         """
-        possible_tiles = []
+        index = tile.coordinates.row * GameMap.MAP_WIDTH + tile.coordinates.col
 
-        for y in range(GameMap.MAP_SIZE.get_row()):
-            for x in range(GameMap.MAP_SIZE.get_col()):
-                tile = self.get_tile(Position(x, y))
+        if index in self.burning_tiles:
+            return
 
-                if tile.kind == MapTile.TILE_FLOOR \
-                        and tile.special_object is None \
-                        and tile.item is None \
-                        and not self.tile_has_player(Position(x, y)):
-                    possible_tiles.append(tile)
+        self.burning_tiles[index] = tile
 
-        for item in items:
-            if len(possible_tiles) == 0:
-                break  # no more tiles to place items on => end
+        if self.burning_tiles_queue is not None and index > self.burning_tile_index:
+            heapq.heappush(self.burning_tiles_queue, index)  # caught fire during update(), its turn is still to come
 
-            tile = random.choice(possible_tiles)
-            tile.item = item
+    # ----------------------------------------------------------------------------
 
-            possible_tiles.remove(tile)
+    def spread_items(self, items: list) -> None:
+        """
+
+        Parameters
+        ----------
+        items : list[int]
+        """
+        # tiles with a player standing on them, taken from the tile index instead of asking for each tile
+        occupied_tiles = {
+            tile for tile, players in self.players_by_tile.items()
+            if any(player.is_on_ground() for player in players)
+        }
+
+        possible_tiles = [
+            tile for tile in self.tiles_flat
+            if tile.kind == MapTile.TILE_FLOOR
+            and tile.special_object is None
+            and tile.item is None
+            and (tile.coordinates.col, tile.coordinates.row) not in occupied_tiles
+        ]
+
+        # each tile gets at most one item, when tiles run out the rest of the items is lost
+        for tile, item in zip(random.sample(possible_tiles, min(len(items), len(possible_tiles))), items):
+            tile.item = item
 
     # ----------------------------------------------------------------------------
 
@@ -1638,18 +1954,15 @@ class GameMap:
         ----------
         dt : int
         """
-        i = 0
-
-        while i < len(self.bombs):  # update all bombs
-            bomb = self.bombs[i]
-
-            if bomb.has_exploded:  # just in case
-                self.bombs.remove(bomb)
-                continue
+        # the same for all bombs in this frame:
+        flying_distance = dt / 1000.0 * Bomb.FLYING_SPEED
+        rolling_distance = dt / 1000.0 * Bomb.ROLLING_SPEED
 
+        # update all bombs, exploding ones get removed on the way (bomb_explodes() removes every bomb it explodes,
+        # so no exploded bomb is left in the snapshot)
+        for bomb in list(self.bombs):
             bomb.time_of_existence += dt
 
-            bomb_position = bomb.get_position()
             bomb_tile = bomb.get_tile_position()
 
             if bomb.movement != Bomb.BOMB_FLYING \
@@ -1661,119 +1974,123 @@ class GameMap:
                     and bomb.is_near_tile_center():
                 self.bomb_explodes(bomb)
                 continue
+
+            if bomb.movement != Bomb.BOMB_NO_MOVEMENT:
+                if bomb.movement == Bomb.BOMB_FLYING:
+                    bomb.flight_info.distance_travelled += flying_distance
+
+                    if bomb.flight_info.distance_travelled >= bomb.flight_info.total_distance_to_travel:
+                        bomb_tile = bomb.get_tile_position()
+                        self.add_sound_event(SoundPlayer.SOUND_EVENT_BOMB_PUT)
+
+                        if not (self.tile_is_walkable(bomb_tile)
+                                or self.tile_has_player(bomb_tile)
+                                or self.tile_has_teleport(bomb_tile)):
+                            bomb.send_flying(bomb_tile + bomb.flight_info.direction)
+                        else:  # bomb lands
+                            bomb.movement = Bomb.BOMB_NO_MOVEMENT
+                            self.get_tile_at(bomb_tile).item = None
+                else:
+                    self.__roll_bomb(bomb, rolling_distance)
+
+    # ----------------------------------------------------------------------------
+
+    def __roll_bomb(self, bomb, rolling_distance: float) -> None:
+        """
+        Moves a rolling bomb, redirects it by arrows and stops (or bounces) it when it hits something.
+
+        Parameters
+        ----------
+        bomb : Bomb
+        rolling_distance : float
+            distance in tiles the bomb rolls in this frame
+        """
+        bomb_position = bomb.get_position()
+        bomb_tile = bomb.get_tile_position()
+        tile = self.get_tile(bomb_tile)
+
+        if bomb.is_near_tile_center():
+            redirect_to = Bomb.ARROW_DIRECTIONS.get(tile.special_object, bomb.movement)
+
+            if redirect_to != bomb.movement:
+                bomb.movement = redirect_to
+
+                if Bomb.ROLLING_DIRECTIONS[redirect_to][0] == 0:  # align with the axis of the new movement
+                    bomb.set_position(Coordinate(bomb_tile.get_col() + 0.5, bomb_position.get_row()))
+                else:
+                    bomb.set_position(Coordinate(bomb_position.get_col(), bomb_tile.get_row() + 0.5))
+
+                bomb_position = bomb.get_position()
+
+        if tile.item is not None:  # rolling bomb destroys items
+            tile.item = None
+
+        col_step, row_step, opposite_direction = Bomb.ROLLING_DIRECTIONS[bomb.movement]
+
+        bomb.set_position(Coordinate(
+            bomb_position.get_col() + col_step * rolling_distance,
+            bomb_position.get_row() + row_step * rolling_distance
+        ))
+
+        # collisions are checked only in a window of the tile part along the movement:
+        if col_step != 0:
+            position_within_tile = bomb_position.get_col() % 1
+        else:
+            position_within_tile = bomb_position.get_row() % 1
+
+        if col_step + row_step > 0:
+            boundaries = GameMap.ROLLING_COLLISION_WINDOW
+        else:
+            boundaries = GameMap.ROLLING_COLLISION_WINDOW_BACKWARDS
+
+        if boundaries[0] < position_within_tile < boundaries[1] \
+                and self._stops_rolling_bomb(bomb_tile.col + col_step, bomb_tile.row + row_step):
+            bomb.move_to_tile_center()
+
+            if bomb.has_spring:
+                bomb.movement = opposite_direction
+                self.add_sound_event(SoundPlayer.SOUND_EVENT_SPRING)
             else:
-                i += 1
+                bomb.movement = Bomb.BOMB_NO_MOVEMENT
+                self.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
+
+    # ----------------------------------------------------------------------------
+
+    def _stops_rolling_bomb(self, col: int, row: int) -> bool:
+        """
+        Checks if a rolling bomb has to stop in front of given tile, i.e. the tile isn't walkable or there is
+        a player or a teleport on it. All checks work on plain ints.
+
+        Parameters
+        ----------
+        col : int
+        row : int
+
+        Return
+        ------
+        bool
+        """
+        if (col, row) in self.rolling_stopper_tiles:
+            return True  # static walls and teleports first, one set lookup
 
-            if bomb.movement != Bomb.BOMB_NO_MOVEMENT:
-                if bomb.movement == Bomb.BOMB_FLYING:
-                    distance_to_travel = dt / 1000.0 * Bomb.FLYING_SPEED
-                    bomb.flight_info.distance_travelled += distance_to_travel
+        if not self._walkable_at(col, row):
+            return True  # blocks, bombs and the map border
 
-                    if bomb.flight_info.distance_travelled >= bomb.flight_info.total_distance_to_travel:
-                        bomb_tile = bomb.get_tile_position()
-                        self.add_sound_event(SoundPlayer.SOUND_EVENT_BOMB_PUT)
+        for player in self.players_by_tile.get((col, row), ()):
+            if player.is_on_ground():
+                return True
 
-                        if not (self.tile_is_walkable(bomb_tile)
-                                or self.tile_has_player(bomb_tile)
-                                or self.tile_has_teleport(bomb_tile)):
-                            bomb.send_flying(bomb_tile + bomb.flight_info.direction)
-                        else:  # bomb lands
-                            bomb.movement = Bomb.BOMB_NO_MOVEMENT
-                            self.get_tile_at(bomb_tile).item = None
-                else:  # bomb rolling
-                    if bomb.is_near_tile_center():
-                        object_at_tile = self.get_tile(bomb_tile).special_object
-
-                        redirected = False
-
-                        if object_at_tile == MapTile.SPECIAL_OBJECT_ARROW_UP and bomb.movement != Bomb.BOMB_ROLLING_UP:
-                            bomb.movement = Bomb.BOMB_ROLLING_UP
-                            bomb.set_position(Coordinate(bomb_tile.get_col() + 0.5, bomb_tile.get_row()))  # aline with x axis
-                            redirected = True
-                        elif object_at_tile == MapTile.SPECIAL_OBJECT_ARROW_RIGHT and bomb.movement != Bomb.BOMB_ROLLING_RIGHT:
-                            bomb.movement = Bomb.BOMB_ROLLING_RIGHT
-                            bomb.set_position(Coordinate(bomb_position.get_col(), bomb_tile.get_row() + 0.5))
-                            redirected = True
-                        elif object_at_tile == MapTile.SPECIAL_OBJECT_ARROW_DOWN and bomb.movement != Bomb.BOMB_ROLLING_DOWN:
-                            bomb.movement = Bomb.BOMB_ROLLING_DOWN
-                            bomb.set_position(Coordinate(bomb_tile.get_col() + 0.5, bomb_position.get_row()))
-                            redirected = True
-                        elif object_at_tile == MapTile.SPECIAL_OBJECT_ARROW_LEFT and bomb.movement != Bomb.BOMB_ROLLING_LEFT:
-                            bomb.movement = Bomb.BOMB_ROLLING_LEFT
-                            bomb.set_position(Coordinate(bomb_position.get_col(), bomb_tile.get_row() + 0.5))
-                            redirected = True
-
-                        if redirected:
-                            bomb_position = bomb.get_position()
-
-                    if self.get_tile(bomb_tile).item is not None:  # rolling bomb destroys items
-                        self.get_tile(bomb_tile).item = None
-
-                    bomb_position_within_tile = Coordinate(bomb_position.get_col() % 1, bomb_position.get_row() % 1)
-                    check_collision = False
-                    forward_tile = None
-                    distance_to_travel = dt / 1000.0 * Bomb.ROLLING_SPEED
-
-                    helper_boundaries = (0.5, 0.9)
-                    helper_boundaries2 = (1 - helper_boundaries[1], 1 - helper_boundaries[0])
-
-                    opposite_direction = Bomb.BOMB_NO_MOVEMENT
-
-                    if bomb.movement == Bomb.BOMB_ROLLING_UP:
-                        bomb.set_position(Coordinate(bomb_position.get_row(), bomb_position.get_col() - distance_to_travel))
-                        opposite_direction = Bomb.BOMB_ROLLING_DOWN
-
-                        if helper_boundaries2[0] < bomb_position_within_tile.get_row() < helper_boundaries2[1]:
-                            check_collision = True
-                            forward_tile = Position(bomb_tile.get_col(), bomb_tile.get_row() - 1)
-
-                    elif bomb.movement == Bomb.BOMB_ROLLING_RIGHT:
-                        bomb.set_position(Coordinate(bomb_position.get_col() + distance_to_travel, bomb_position.get_row()))
-                        opposite_direction = Bomb.BOMB_ROLLING_LEFT
-
-                        if helper_boundaries[0] < bomb_position_within_tile.get_col() < helper_boundaries[1]:
-                            check_collision = True
-                            forward_tile = Position(bomb_tile.get_col() + 1, bomb_tile.get_row())
-
-                    elif bomb.movement == Bomb.BOMB_ROLLING_DOWN:
-                        bomb.set_position(Coordinate(bomb_position.get_col(), bomb_position.get_row() + distance_to_travel))
-                        opposite_direction = Bomb.BOMB_ROLLING_UP
-
-                        if helper_boundaries[0] < bomb_position_within_tile.get_row() < helper_boundaries[1]:
-                            check_collision = True
-                            forward_tile = Position(bomb_tile.get_col(), bomb_tile.get_row() + 1)
-
-                    elif bomb.movement == Bomb.BOMB_ROLLING_LEFT:
-                        bomb.set_position(Coordinate(bomb_position.get_col() - distance_to_travel, bomb_position.get_row()))
-                        opposite_direction = Bomb.BOMB_ROLLING_RIGHT
-
-                        if helper_boundaries2[0] < bomb_position_within_tile.get_col() < helper_boundaries2[1]:
-                            check_collision = True
-                            forward_tile = Position(bomb_tile.get_col() - 1, bomb_tile.get_row())
-
-                    if check_collision and (
-                        not self.tile_is_walkable(forward_tile)
-                        or self.tile_has_player(forward_tile)
-                        or self.tile_has_teleport(forward_tile)
-                    ):
-                        bomb.move_to_tile_center()
-
-                        if bomb.has_spring:
-                            bomb.movement = opposite_direction
-                            self.add_sound_event(SoundPlayer.SOUND_EVENT_SPRING)
-                        else:
-                            bomb.movement = Bomb.BOMB_NO_MOVEMENT
-                            self.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
+        return False
 
     # ----------------------------------------------------------------------------
 
-    def __update_players(self, dt: int, immortal_player_numbers: list) -> None:
+    def __update_players(self, dt: int, immortal_player_numbers: frozenset) -> None:
         """
 
         Parameters
         ----------
         dt : int
-        immortal_player_numbers : list[int]
+        immortal_player_numbers : frozenset[int]
         """
         time_now = pygame.time.get_ticks()
         release_disease_cloud = False
@@ -1786,27 +2103,24 @@ class GameMap:
             if player.is_dead():
                 continue
 
+            player_state = player.get_state()
+
             if release_disease_cloud and player.get_disease() != Player.DISEASE_NONE:
                 self.add_animation_event(
                     Renderer.ANIMATION_EVENT_DISEASE_CLOUD,
                     Renderer.map_position_to_pixel_position(player.get_position(), Position())
                 )
 
-            if self.winning_color == -1:
-                self.winning_color = player.get_team_number()
-            elif self.winning_color != player.get_team_number():
-                self.game_is_over = False
-
             player_tile_position = player.get_tile_position()
             player_tile = self.get_tile(player_tile_position)
 
-            if player.get_state() != Player.STATE_IN_AIR \
-                and player.get_state != Player.STATE_TELEPORTING \
-                    and (self.tile_has_flame(player_tile.coordinates) or self.tile_has_lava(player_tile.coordinates)):
+            if player_state != Player.STATE_IN_AIR \
+                and player_state != Player.STATE_TELEPORTING \
+                    and (player_tile.flame_count > 0 or player_tile.special_object == MapTile.SPECIAL_OBJECT_LAVA):
 
                 # if player immortality cheat isn't activated
                 if not (player.get_number() in immortal_player_numbers):
-                    flames = self.get_tile_at(player_tile.coordinates).flames
+                    flames = player_tile.flames
 
                     # assign kill counts
 
@@ -1833,87 +2147,87 @@ class GameMap:
                     and player.is_near_tile_center():
                 player.teleport(self)
             elif player.get_disease() != Player.DISEASE_NONE:
-                players_at_tile = self.get_players_at_tile(player_tile_position)
-
                 transmitted = False
 
-                for player_at_tile in players_at_tile:
-                    if player_at_tile.get_disease() == Player.DISEASE_NONE:
+                # straight from the tile index, no sorted copy of the players needed here
+                for player_at_tile in self.players_by_tile.get((player_tile_position.col, player_tile_position.row), ()):
+                    if player_at_tile.disease == Player.DISEASE_NONE \
+                            and player_at_tile.is_on_ground():
                         transmitted = True
-                        player_at_tile.set_disease(player.get_disease(), player.get_disease_time())  # transmit disease
+                        player_at_tile.set_disease(player.disease, player.disease_time_left)  # transmit disease
 
                 # if transmitted and random.randint(0,2) == 0:
                 #  self.add_sound_event(SoundPlayer.SOUND_EVENT_GO_AWAY)
 
     # ----------------------------------------------------------------------------
 
-    def update(self, dt: int, immortal_player_numbers=[]) -> None:
+    def update(self, dt: int, immortal_player_numbers: list or None = None) -> None:
         """
         Updates some things on the map that change with time.
 
         Parameters
         ----------
         dt : int
-        immortal_player_numbers : list[int]
+        immortal_player_numbers : list[int] or None, default=None
         """
         self.time_from_start += dt
 
-        self.danger_map_is_up_to_date = False  # reset this each frame
-
-        i = 0
-
         self.earthquake_time_left = max(0, self.earthquake_time_left - dt)
 
-        while i < len(self.items_to_give_away):  # giving away items of dead players
-            item = self.items_to_give_away[i]
+        # giving away items of dead players:
+        items_to_give_now = [item for item in self.items_to_give_away if self.time_from_start >= item[0]]
 
-            if self.time_from_start >= item[0]:
-                self.spread_items(item[1])
-                self.items_to_give_away.remove(item)
+        if len(items_to_give_now) > 0:
+            self.items_to_give_away = [item for item in self.items_to_give_away if self.time_from_start < item[0]]
 
+            for item in items_to_give_now:
+                self.spread_items(item[1])
                 debug_log("giving away items")
 
-            i += 1
-
         self.__update_bombs(dt)
 
-        for line in self.tiles:
-            for tile in line:
-                if tile.to_be_destroyed and tile.kind == MapTile.TILE_BLOCK and not self.tile_has_flame(
-                        tile.coordinates):
-                    tile.kind = MapTile.TILE_FLOOR
-                    self.number_of_blocks -= 1
-                    tile.to_be_destroyed = False
-
-                i = 0
+        # only burning tiles need updating, in the row-major order of the whole grid; tiles set on fire during this
+        # pass still get updated in it when they come later in that order
+        self.burning_tiles_queue = sorted(self.burning_tiles)  # a sorted list already is a heap
 
-                while True:
-                    if i >= len(tile.flames):
-                        break
+        while len(self.burning_tiles_queue) > 0:
+            self.burning_tile_index = heapq.heappop(self.burning_tiles_queue)
+            tile = self.burning_tiles[self.burning_tile_index]
 
-                    if tile.kind == MapTile.TILE_BLOCK:  # flame on a block tile -> destroy the block
+            if tile.to_be_destroyed and tile.flame_count == 0 and tile.kind == MapTile.TILE_BLOCK:
+                tile.kind = MapTile.TILE_FLOOR
+                self.number_of_blocks -= 1
+                tile.to_be_destroyed = False
+                self.danger_map_version += 1
+                self.danger_base = None
+
+            if tile.flame_count > 0:
+                if tile.kind == MapTile.TILE_BLOCK:  # flame on a block tile -> destroy the block
+                    if not tile.to_be_destroyed:
                         tile.to_be_destroyed = True
-                    elif tile.kind == MapTile.TILE_FLOOR and tile.item is not None:
-                        tile.item = None  # flame destroys the item
-
-                    bombs_inside_flame = self.bombs_on_tile(tile.coordinates)
+                        self.danger_map_version += 1
+                elif tile.kind == MapTile.TILE_FLOOR and tile.item is not None:
+                    tile.item = None  # flame destroys the item
 
-                    for bomb in bombs_inside_flame:  # bomb inside flame -> detonate it
+                if tile.coordinates.get_tuple() in self.bombs_by_tile:  # bomb inside flame -> detonate it
+                    for bomb in self.bombs_on_tile(tile.coordinates):
                         self.bomb_explodes(bomb)
 
-                    flame = tile.flames[i]
+                if tile.burn_flames(dt):
+                    self.danger_map_version += 1
+                    self.danger_base = None
 
-                    flame.time_to_burnout -= dt
+            if tile.flame_count == 0 and not tile.to_be_destroyed:
+                del self.burning_tiles[self.burning_tile_index]  # back to rest
 
-                    if flame.time_to_burnout < 0:
-                        tile.flames.remove(flame)
+        self.burning_tiles_queue = None
 
-                    i += 1
+        # the game is over when at most one team is alive (players dying in this update still count):
+        alive_team_numbers = [team for team, alive_players in self.alive_players_by_team.items() if alive_players > 0]
+        self.winning_color = alive_team_numbers[0] if len(alive_team_numbers) > 0 else -1
+        self.game_is_over = len(alive_team_numbers) <= 1
 
-        self.game_is_over = True
-        self.winning_color = -1
-
-        self.__update_players(dt, immortal_player_numbers)
+        self.__update_players(dt, frozenset(immortal_player_numbers or ()))
 
         if self.state == GameMap.STATE_WAITING_TO_PLAY:
             if self.time_from_start >= self.start_game_at:
@@ -1951,12 +2265,37 @@ class GameMap:
         ----------
         bomb : Bomb
         """
-        self.bombs.append(bomb)
+        self.bombs[bomb] = self.bombs_laid
+        self.bombs_laid += 1
+        bomb.game_map = self
+        self.update_bomb_tile(bomb)
+
+    # ----------------------------------------------------------------------------
+
+    def remove_bomb(self, bomb) -> None:
+        """
+
+        Parameters
+        ----------
+        bomb : Bomb
+        """
+        self.bombs.pop(bomb, None)
+
+        if bomb.game_map is self:
+            bomb.game_map = None
+            self.update_bomb_tile(bomb)
 
     # ----------------------------------------------------------------------------
 
     def get_bombs(self) -> list:
-        return self.bombs
+        """
+        Gets bombs on the map in the order they were laid.
+
+        Return
+        ------
+        list[Bomb]
+        """
+        return list(self.bombs)
 
     # ----------------------------------------------------------------------------
 
@@ -1976,18 +2315,38 @@ class GameMap:
 
     # ----------------------------------------------------------------------------
 
-    def get_players_by_numbers(self) -> dict:
+    def get_players_by_numbers(self) -> list:
         """
-        Gets a dict that maps numbers to players (with Nones if player with given number doesn't exist).
+        Gets a list indexed by player numbers (with Nones if player with given number doesn't exist).
 
         Return
         ------
-        dict[int, Player]
+        list[Player or None]
         """
         return self.players_by_numbers
 
     # ----------------------------------------------------------------------------
 
+    def get_player(self, number: int):
+        """
+        Gets player with given number.
+
+        Parameters
+        ----------
+        number : int
+
+        Return
+        ------
+        Player or None
+            None if player with given number doesn't exist (negative numbers mean no player)
+        """
+        if 0 <= number < len(self.players_by_numbers):
+            return self.players_by_numbers[number]
+
+        return None
+
+    # ----------------------------------------------------------------------------
+
     def get_tiles(self) -> list:
         """
 
@@ -2028,12 +2387,22 @@ class Positionable:
     x : float
     y : float
     position : Coordinate
+        read only, change it with set_position() which calls position_changed() and forgets the cached tile position
     """
 
+    NEAR_CENTER_LIMIT = 0.2  ##< position within tile must be between this and NEAR_CENTER_LIMIT2 to be near center
+    NEAR_CENTER_LIMIT2 = 1.0 - NEAR_CENTER_LIMIT
+
+    __slots__ = ('x', 'y', 'position', '_tile_position')
+
     def __init__(self):
-        self.x = 0.0
-        self.y = 0.0
-        self.position = Coordinate()
+        self.set_position(Coordinate())
+
+    def position_changed(self) -> None:
+        """
+        Called after the position has been changed, subclasses can keep things depending on it in sync
+        """
+        pass
 
     def set_position(self, position: Coordinate) -> None:
         """
@@ -2043,8 +2412,12 @@ class Positionable:
         ----------
         position : Coordinate
         """
-        self.x, self.y = position.get_tuple()
+        # position stays a plain attribute for the many reads, the only place it's written is here
+        self.x = position.col
+        self.y = position.row
         self.position = position
+        self._tile_position = None  # computed again on demand by get_tile_position()
+        self.position_changed()
 
     def get_position(self) -> Coordinate:
         """
@@ -2081,7 +2454,10 @@ class Positionable:
         -------
         Position
         """
-        return Positionable.position_to_tile(self.position)
+        if self._tile_position is None:
+            self._tile_position = Positionable.position_to_tile(self.position)
+
+        return self._tile_position
 
     def move_to_tile_center(self, tile_coordinates: Coordinate or Position or None = None) -> None:
         """
@@ -2091,10 +2467,16 @@ class Positionable:
         ----------
         tile_coordinates : Coordinate or Position or None, default=None
         """
-        if tile_coordinates is not None:
-            self.position = tile_coordinates
+        if tile_coordinates is None:
+            tile_coordinates = self.position
+
+        col = math.floor(tile_coordinates.col) + 0.5
+        row = math.floor(tile_coordinates.row) + 0.5
+
+        if self.position.col == col and self.position.row == row:
+            return  # already centered, spare the new coordinate and the tile index update in position_changed()
 
-        self.position = Coordinate(math.floor(self.position.get_col()) + 0.5, math.floor(self.position.get_row()) + 0.5)
+        self.set_position(Coordinate(col, row))
 
     @staticmethod
     def position_to_tile(position: Coordinate or Position) -> Position:
@@ -2109,7 +2491,28 @@ class Positionable:
         ------
         Position
         """
-        return Position(int(math.floor(position.get_col())), int(math.floor(position.get_row())))
+        if type(position) is Position:
+            return position  # already a tile, positions are immutable
+
+        return Position(math.floor(position.col), math.floor(position.row))
+
+    @staticmethod
+    def position_to_tile_tuple(position: Coordinate or Position) -> tuple:
+        """
+        Same as position_to_tile(), but returns plain ints, for lookups and bounds checks.
+
+        Parameters
+        ----------
+        position : Coordinate or Position
+
+        Return
+        ------
+        tuple[int, int]
+        """
+        if type(position) is Position:
+            return position.col, position.row
+
+        return math.floor(position.col), math.floor(position.row)
 
     def is_near_tile_center(self) -> bool:
         """
@@ -2119,12 +2522,11 @@ class Positionable:
         -------
         bool
         """
-        position_within_tile = (self.position.get_col() % 1, self.position.get_row() % 1)
+        limit = Positionable.NEAR_CENTER_LIMIT
+        limit2 = Positionable.NEAR_CENTER_LIMIT2
 
-        limit = 0.2
-        limit2 = 1.0 - limit
-
-        return (limit < position_within_tile[0] < limit2) and (limit < position_within_tile[1] < limit2)
+        # no tuple, and the row is not needed at all when the column is already off
+        return limit < self.position.col % 1 < limit2 and limit < self.position.row % 1 < limit2
 
 
 # ==============================================================================
@@ -2194,8 +2596,10 @@ class Player(Positionable):
         how many more bombs the player can put at the time
     flame_length : int
         how long the flame is in tiles
-    items : dict[int, int]
-        which items and how many the player has, format: [item code]: count
+    items : list[int]
+        how many of each item the player has, indexed by item code (see GameMap.ITEM_* constants)
+    item_order : list[int]
+        codes of the items the player has, in the order they were first got
     has_spring : bool
         whether player's bombs have springs
     has_shoe : bool
@@ -2229,8 +2633,22 @@ class Player(Positionable):
     info_board_update_needed : bool
     kills : int
     wins : int
+    game_map : GameMap or None
+        map the player plays on, notified about player's tile changes
+    indexed_tile : tuple[int, int] or None
+        under which tile the map keeps the player in its players_by_tile index
     """
 
+    # looked up many times per frame by the map, the AI and the renderer
+    __slots__ = (
+        'number', 'team_number', 'state', 'state_time', 'speed', 'bombs_left', 'flame_length', 'items', 'has_spring',
+        'has_shoe', 'disease_time_left', 'disease', 'has_multibomb', 'has_boxing_glove', 'has_throwing_glove', 'boxing',
+        'detonator_bombs_left', 'detonator_bombs', 'wait_for_special_release', 'wait_for_bomb_release',
+        'throwing_time_left', 'state_backup', 'jumping_from', 'jumping_to', 'teleporting_to', 'wait_for_tile_transition',
+        'invincible', 'info_board_update_needed', 'kills', 'wins', 'game_map', 'indexed_tile', 'putting_bomb',
+        'putting_multibomb', 'throwing', 'diarrhea_action', 'item_order'
+    )
+
     # possible player states
     STATE_IDLE_UP = 0
     STATE_IDLE_RIGHT = 1
@@ -2244,6 +2662,43 @@ class Player(Positionable):
     STATE_TELEPORTING = 9
     STATE_DEAD = 10
 
+    ITEM_CODE_COUNT = GameMap.ITEM_THROWING_GLOVE + 1  ##< item codes are 0 to this - 1, see GameMap.ITEM_* constants
+
+    RANDOM_ITEM_CHOICES = (  ##< items the random item can turn into
+        GameMap.ITEM_BOMB,
+        GameMap.ITEM_FLAME,
+        GameMap.ITEM_SUPERFLAME,
+        GameMap.ITEM_MULTIBOMB,
+        GameMap.ITEM_SPRING,
+        GameMap.ITEM_SHOE,
+        GameMap.ITEM_SPEEDUP,
+        GameMap.ITEM_DISEASE,
+        GameMap.ITEM_BOXING_GLOVE,
+        GameMap.ITEM_DETONATOR,
+        GameMap.ITEM_THROWING_GLOVE
+    )
+
+    OFF_GROUND_STATES = frozenset((STATE_IN_AIR, STATE_DEAD))  ##< states in which the player doesn't occupy a tile
+    STATE_DIRECTION_NUMBERS = (0, 1, 2, 3, 0, 1, 2, 3, 3, 3, 3)  ##< direction number for each state, left when not facing any
+    DIRECTION_VECTORS = (Position(0, -1), Position(1, 0), Position(0, 1), Position(-1, 0))  ##< for each direction number
+
+    # (collision type, state) -> how the player reacts to a border collision: () means stopped by the border,
+    # otherwise the direction of the sideways shift along it; pairs not listed don't react at all
+    BORDER_COLLISION_RESPONSES = {
+        (GameMap.COLLISION_BORDER_UP, STATE_WALKING_UP): (),
+        (GameMap.COLLISION_BORDER_UP, STATE_WALKING_LEFT): (1.0, 0.0),
+        (GameMap.COLLISION_BORDER_UP, STATE_WALKING_RIGHT): (1.0, 0.0),
+        (GameMap.COLLISION_BORDER_DOWN, STATE_WALKING_DOWN): (),
+        (GameMap.COLLISION_BORDER_DOWN, STATE_WALKING_LEFT): (-1.0, 0.0),
+        (GameMap.COLLISION_BORDER_DOWN, STATE_WALKING_RIGHT): (-1.0, 0.0),
+        (GameMap.COLLISION_BORDER_RIGHT, STATE_WALKING_RIGHT): (),
+        (GameMap.COLLISION_BORDER_RIGHT, STATE_WALKING_UP): (0.0, -1.0),
+        (GameMap.COLLISION_BORDER_RIGHT, STATE_WALKING_DOWN): (0.0, -1.0),
+        (GameMap.COLLISION_BORDER_LEFT, STATE_WALKING_LEFT): (),
+        (GameMap.COLLISION_BORDER_LEFT, STATE_WALKING_UP): (0.0, 1.0),
+        (GameMap.COLLISION_BORDER_LEFT, STATE_WALKING_DOWN): (0.0, 1.0)
+    }
+
     DISEASE_NONE = 0
     DISEASE_DIARRHEA = 1
     DISEASE_SLOW = 2
@@ -2254,18 +2709,35 @@ class Player(Positionable):
     DISEASE_NO_BOMB = 7
     DISEASE_EARTHQUAKE = 8
 
+    DISEASE_CHOICES = (  ##< diseases a disease item can cause, their sounds are in SoundPlayer.DISEASE_SOUND_EVENTS
+        DISEASE_SHORT_FLAME,
+        DISEASE_SLOW,
+        DISEASE_DIARRHEA,
+        DISEASE_FAST_BOMB,
+        DISEASE_REVERSE_CONTROLS,
+        DISEASE_SWITCH_PLAYERS,
+        DISEASE_NO_BOMB,
+        DISEASE_EARTHQUAKE
+    )
+
     INITIAL_SPEED = 3
     SLOW_SPEED = 1.5
     MAX_SPEED = 10
     SPEEDUP_VALUE = 1
     DISEASE_TIME = 20000
+    MAX_STEP_TIME = 34  ##< longest time step (in ms) the player moves by at once, longer frames are split into more steps
 
     JUMP_DURATION = 2000
     TELEPORT_DURATION = 1500
+    AIRBORNE_DURATIONS = {STATE_IN_AIR: JUMP_DURATION, STATE_TELEPORTING: TELEPORT_DURATION}  ##< how long (in ms) the player stays out of play in each state
+
+    DEATH_ANIMATION_OFFSET = Position(0, -15)  ##< pixel offset of the death animation from the player
 
     # ----------------------------------------------------------------------------
 
     def __init__(self):
+        self.game_map = None  ##< set by GameMap when the player is placed on it
+        self.indexed_tile = None
         super().__init__()
         self.number = 0  ##< player's number
         self.team_number = 0  ##< team number, determines player's color
@@ -2274,11 +2746,12 @@ class Player(Positionable):
         self.speed = Player.INITIAL_SPEED  ##< speed in tiles per second
         self.bombs_left = 1  ##< how many more bombs the player can put at the time
         self.flame_length = 1  ##< how long the flame is in tiles
-        self.items = {}  ##< which items and how many the player has, format: [item code]: count
+        self.items = [0] * Player.ITEM_CODE_COUNT  ##< how many of each item the player has, indexed by item code
         self.has_spring = False  ##< whether player's bombs have springs
         self.has_shoe = False  ##< whether player has a kicking shoe
         self.disease_time_left = 0
         self.disease = Player.DISEASE_NONE
+        self.diarrhea_action = PlayerActions(self.number, PlayerKeyMaps.ACTION_BOMB)  ##< reused bomb event injected by diarrhea
         self.has_multibomb = False
         self.has_boxing_glove = False
         self.has_throwing_glove = False
@@ -2300,6 +2773,7 @@ class Player(Positionable):
 
         self.items[GameMap.ITEM_BOMB] = 1
         self.items[GameMap.ITEM_FLAME] = 1
+        self.item_order = [GameMap.ITEM_BOMB, GameMap.ITEM_FLAME]  ##< item codes in the order they were first got
 
     # ----------------------------------------------------------------------------
 
@@ -2325,6 +2799,12 @@ class Player(Positionable):
 
     # ----------------------------------------------------------------------------
 
+    def position_changed(self) -> None:
+        if self.game_map is not None:
+            self.game_map.update_player_tile(self)
+
+    # ----------------------------------------------------------------------------
+
     def info_board_needs_update(self) -> bool:
         if self.info_board_update_needed:
             self.info_board_update_needed = False
@@ -2351,10 +2831,7 @@ class Player(Positionable):
     # ----------------------------------------------------------------------------
 
     def is_walking(self) -> bool:
-        return self.state in [Player.STATE_WALKING_UP,
-                              Player.STATE_WALKING_RIGHT,
-                              Player.STATE_WALKING_DOWN,
-                              Player.STATE_WALKING_LEFT]
+        return Player.STATE_WALKING_UP <= self.state <= Player.STATE_WALKING_LEFT  # walking states are contiguous
 
     # ----------------------------------------------------------------------------
 
@@ -2377,16 +2854,16 @@ class Player(Positionable):
 
         self.info_board_update_needed = True
 
+        if not self.is_dead():
+            game_map.player_died(self)
+
         self.state = Player.STATE_DEAD
         game_map.add_sound_event(SoundPlayer.SOUND_EVENT_DEATH)
 
-        random_animation = random.choice((
-            Renderer.ANIMATION_EVENT_DIE,
-            Renderer.ANIMATION_EVENT_EXPLOSION,
-            Renderer.ANIMATION_EVENT_RIP,
-            Renderer.ANIMATION_EVENT_SKELETION))
+        random_animation = random.choice(Renderer.DEATH_ANIMATION_EVENTS)
 
-        game_map.add_animation_event(random_animation, Renderer.map_position_to_pixel_position(self.position, Position(0, -15)))
+        game_map.add_animation_event(random_animation, Renderer.map_position_to_pixel_position(
+            self.position, Player.DEATH_ANIMATION_OFFSET))
         game_map.give_away_items(self.get_items())
 
     # ----------------------------------------------------------------------------
@@ -2410,15 +2887,7 @@ class Player(Positionable):
         """
         Returns a number that says which way the player is facing (0 - up, 1 - right, 2 - down, 3 - left).
         """
-
-        if self.state in [Player.STATE_IDLE_UP, Player.STATE_WALKING_UP]:
-            return 0
-        elif self.state in [Player.STATE_IDLE_RIGHT, Player.STATE_WALKING_RIGHT]:
-            return 1
-        elif self.state in [Player.STATE_IDLE_DOWN, Player.STATE_WALKING_DOWN]:
-            return 2
-        else:
-            return 3
+        return Player.STATE_DIRECTION_NUMBERS[self.state]
 
     # ----------------------------------------------------------------------------
 
@@ -2474,12 +2943,15 @@ class Player(Positionable):
     # ----------------------------------------------------------------------------
 
     def get_items(self) -> tuple:
-        result = []
-
-        for item in self.items:
-            result += [item for i in range(self.items[item])]
+        """
+        Lists all items the player has, each as many times as the player has it. The items go in the order they were
+        first got (e.g. handing them back on death relies on it).
 
-        return tuple(result)
+        Return
+        ------
+        tuple[int]
+        """
+        return tuple(itertools.chain.from_iterable(itertools.repeat(item, self.items[item]) for item in self.item_order))
 
     # ----------------------------------------------------------------------------
 
@@ -2497,12 +2969,15 @@ class Player(Positionable):
 
         # find a landing tile
 
-        for y in range(self.jumping_from.get_row() - 3, self.jumping_from.get_row() + 4):
-            for x in range(self.jumping_from.get_col() - 3, self.jumping_from.get_col() + 4):
-                tile = game_map.get_tile_at(Position(x, y))
+        # only the part of the 7x7 square around the player that lies on the map
+        cols = range(max(self.jumping_from.col - 3, 0), min(self.jumping_from.col + 4, GameMap.MAP_LAST_COL + 1))
 
-                if (tile is not None) and game_map.tile_is_walkable(Position(x, y)) and tile.special_object is None:
-                    landing_tiles.append(Position(x, y))
+        for y in range(max(self.jumping_from.row - 3, 0), min(self.jumping_from.row + 4, GameMap.MAP_LAST_ROW + 1)):
+            for x in cols:
+                tile = game_map.tiles_flat[y * GameMap.MAP_WIDTH + x]  # straight from plain ints, no Position needed
+
+                if tile.special_object is None and game_map.tile_is_walkable(tile.coordinates):
+                    landing_tiles.append(tile.coordinates)
 
         if len(landing_tiles) == 0:  # this should practically not happen
             self.jumping_to = Position(self.jumping_from.get_col(), self.jumping_from.get_row() + 1)
@@ -2550,6 +3025,14 @@ class Player(Positionable):
 
     # ----------------------------------------------------------------------------
 
+    def is_on_ground(self) -> bool:
+        """
+        Says whether the player is alive and not in the air, i.e. occupies its tile (also while teleporting).
+        """
+        return self.state not in Player.OFF_GROUND_STATES
+
+    # ----------------------------------------------------------------------------
+
     def is_throwing(self) -> bool:
         return self.throwing_time_left > 0
 
@@ -2566,41 +3049,44 @@ class Player(Positionable):
     # ----------------------------------------------------------------------------
 
     def get_item_count(self, item: int) -> int:
-        if item not in self.items:
-            return 0
+        """
+        Says how many of a given item the player has.
+
+        Parameters
+        ----------
+        item : int
 
-        return self.items[item]
+        Return
+        ----------
+        int
+        """
+        return self.items[item] if item >= 0 else 0  # negative codes are unknown items
 
     # ----------------------------------------------------------------------------
 
     def give_item(self, item: int, game_map: GameMap = None) -> None:
         """
         Gives player an item with given code (see GameMap class constants). game_map is needed so that sounds can be
-        made on item pickup - if no map is provided, no sounds will be generated.
+        made on item pickup - if no map is provided, no sounds will be generated. Negative codes (e.g. an unknown
+        letter given by GameMap.letter_to_item()) are ignored.
 
         Parameters
         ----------
         item : int
         game_map : GameMap or None
         """
-        self.items[item] = 1 if item not in self.items else self.items[item] + 1
+        if item < 0:
+            return
+
+        if self.items[item] == 0:
+            self.item_order.append(item)
+
+        self.items[item] += 1
 
         self.info_board_update_needed = True
 
         if item == GameMap.ITEM_RANDOM:
-            item = random.choice((
-                GameMap.ITEM_BOMB,
-                GameMap.ITEM_FLAME,
-                GameMap.ITEM_SUPERFLAME,
-                GameMap.ITEM_MULTIBOMB,
-                GameMap.ITEM_SPRING,
-                GameMap.ITEM_SHOE,
-                GameMap.ITEM_SPEEDUP,
-                GameMap.ITEM_DISEASE,
-                GameMap.ITEM_BOXING_GLOVE,
-                GameMap.ITEM_DETONATOR,
-                GameMap.ITEM_THROWING_GLOVE
-            ))
+            item = random.choice(Player.RANDOM_ITEM_CHOICES)
 
         sound_to_make = SoundPlayer.SOUND_EVENT_CLICK
 
@@ -2609,7 +3095,7 @@ class Player(Positionable):
         elif item == GameMap.ITEM_FLAME:
             self.flame_length += 1
         elif item == GameMap.ITEM_SUPERFLAME:
-            self.flame_length = max(GameMap.MAP_SIZE.get_col(), GameMap.MAP_SIZE.get_row())
+            self.flame_length = max(GameMap.MAP_WIDTH, GameMap.MAP_HEIGHT)
         elif item == GameMap.ITEM_MULTIBOMB:
             self.has_multibomb = True
         elif item == GameMap.ITEM_DETONATOR:
@@ -2626,38 +3112,26 @@ class Player(Positionable):
         elif item == GameMap.ITEM_THROWING_GLOVE:
             self.has_throwing_glove = True
         elif item == GameMap.ITEM_DISEASE:
-            chosen_disease = random.choice([
-                (Player.DISEASE_SHORT_FLAME, SoundPlayer.SOUND_EVENT_DISEASE),
-                (Player.DISEASE_SLOW, SoundPlayer.SOUND_EVENT_SLOW),
-                (Player.DISEASE_DIARRHEA, SoundPlayer.SOUND_EVENT_DIARRHEA),
-                (Player.DISEASE_FAST_BOMB, SoundPlayer.SOUND_EVENT_DISEASE),
-                (Player.DISEASE_REVERSE_CONTROLS, SoundPlayer.SOUND_EVENT_DISEASE),
-                (Player.DISEASE_SWITCH_PLAYERS, SoundPlayer.SOUND_EVENT_DISEASE),
-                (Player.DISEASE_NO_BOMB, SoundPlayer.SOUND_EVENT_DISEASE),
-                (Player.DISEASE_EARTHQUAKE, SoundPlayer.SOUND_EVENT_EARTHQUAKE)
-            ])
-
-            if chosen_disease[0] == Player.DISEASE_SWITCH_PLAYERS:
-                if game_map is not None:
-                    players = list(filter(lambda p: not p.is_dead(), game_map.get_players()))
+            chosen_disease = random.choice(Player.DISEASE_CHOICES)
 
-                    player_to_switch = self
+            if chosen_disease == Player.DISEASE_SWITCH_PLAYERS:
+                if game_map is not None:
+                    other_players = [p for p in game_map.get_players() if p is not self and not p.is_dead()]
 
-                    if len(players) > 1:  # should always be true
-                        while player_to_switch == self:
-                            player_to_switch = random.choice(players)
+                    if len(other_players) > 0:  # should always be true
+                        player_to_switch = random.choice(other_players)
 
-                    my_position = self.get_position()
-                    self.set_position(player_to_switch.get_position())
-                    player_to_switch.set_position(my_position)
-            elif chosen_disease[0] == Player.DISEASE_EARTHQUAKE:
+                        my_position = self.get_position()
+                        self.set_position(player_to_switch.get_position())
+                        player_to_switch.set_position(my_position)
+            elif chosen_disease == Player.DISEASE_EARTHQUAKE:
                 if game_map is not None:
                     game_map.start_earthquake()
             else:
-                self.disease = chosen_disease[0]
+                self.disease = chosen_disease
                 self.disease_time_left = Player.DISEASE_TIME
 
-            sound_to_make = chosen_disease[1]
+            sound_to_make = SoundPlayer.DISEASE_SOUND_EVENTS[chosen_disease]
 
         if (game_map is not None) and (sound_to_make is not None):
             game_map.add_sound_event(sound_to_make)
@@ -2675,8 +3149,7 @@ class Player(Positionable):
         new_bomb = Bomb(self)
 
         if tile_coordinates is not None:
-            new_bomb.set_position(Coordinate(*tile_coordinates.get_tuple()))
-            new_bomb.move_to_tile_center()
+            new_bomb.move_to_tile_center(tile_coordinates)
 
         game_map.add_bomb(new_bomb)
         game_map.add_sound_event(SoundPlayer.SOUND_EVENT_BOMB_PUT)
@@ -2725,27 +3198,13 @@ class Player(Positionable):
 
     # ----------------------------------------------------------------------------
 
-    def how_many_items(self, item: int) -> int:
-        """
-        Says how many of a given item the player has.
-
-        Parameters
-        ----------
-        item : int
-
-        Return
-        ----------
-        int
-        """
-        if item not in self.items:
-            return 0
-
-        return self.items[item]
+    how_many_items = get_item_count  # alias, one implementation for both names
 
     # ----------------------------------------------------------------------------
 
     def set_number(self, number: int) -> None:
         self.number = number
+        self.diarrhea_action = PlayerActions(number, PlayerKeyMaps.ACTION_BOMB)
 
     # ----------------------------------------------------------------------------
 
@@ -2790,14 +3249,7 @@ class Player(Positionable):
         ----------
         tuple[int, int]
         """
-        if self.state in [Player.STATE_WALKING_UP, Player.STATE_IDLE_UP]:
-            return Position(0, -1)
-        elif self.state in [Player.STATE_WALKING_RIGHT, Player.STATE_IDLE_RIGHT]:
-            return Position(1, 0)
-        elif self.state in [Player.STATE_WALKING_DOWN, Player.STATE_IDLE_DOWN]:
-            return Position(0, 1)
-        else:  # left
-            return Position(-1, 0)
+        return Player.DIRECTION_VECTORS[Player.STATE_DIRECTION_NUMBERS[self.state]]
 
     # ----------------------------------------------------------------------------
 
@@ -2811,7 +3263,8 @@ class Player(Positionable):
 
     # ----------------------------------------------------------------------------
 
-    def __manage_input_actions(self, input_actions: list, game_map: GameMap, distance_to_travel: float) -> None:
+    def __manage_input_actions(self, input_actions: list, game_map: GameMap, distance_to_travel: float,
+                               first_step: bool) -> None:
         """
 
         Parameters
@@ -2819,6 +3272,8 @@ class Player(Positionable):
         input_actions : list[PlayerActions]
         game_map : GameMap
         distance_to_travel : float
+        first_step : bool
+            if False, only the movement actions are handled
         """
         moved = False  # to allow movement along only one axis at a time
         detonator_triggered = False
@@ -2832,32 +3287,28 @@ class Player(Positionable):
             input_action = item.action
 
             if self.disease == Player.DISEASE_REVERSE_CONTROLS:
-                input_action = PlayerKeyMaps.get_opposite_action(input_action)
+                input_action = PlayerKeyMaps.OPPOSITE_ACTIONS.get(input_action, input_action)
 
             if not moved:
-                if input_action == PlayerKeyMaps.ACTION_UP:
-                    self.position -= Coordinate(0.0, distance_to_travel)
-                    self.state = Player.STATE_WALKING_UP
-                    moved = True
-                elif input_action == PlayerKeyMaps.ACTION_DOWN:
-                    self.position += Coordinate(0.0, distance_to_travel)
-                    self.state = Player.STATE_WALKING_DOWN
-                    moved = True
-                elif input_action == PlayerKeyMaps.ACTION_RIGHT:
-                    self.position += Coordinate(distance_to_travel)
-                    self.state = Player.STATE_WALKING_RIGHT
-                    moved = True
-                elif input_action == PlayerKeyMaps.ACTION_LEFT:
-                    self.position -= Coordinate(distance_to_travel)
-                    self.state = Player.STATE_WALKING_LEFT
+                movement = PlayerKeyMaps.MOVEMENT_ACTIONS.get(input_action)
+
+                if movement is not None:
+                    # new position is built straight from the scalar components - no temporary offset object
+                    # and no operator dispatch; the object is replaced, not mutated, because bombs share it
+                    col_step, row_step, self.state = movement
+                    self.set_position(Coordinate(self.position.col + col_step * distance_to_travel,
+                                                 self.position.row + row_step * distance_to_travel))
                     moved = True
 
+            if not first_step:
+                continue  # the other actions have been handled in the first sub-step of this frame
+
             if input_action == PlayerKeyMaps.ACTION_BOMB:
                 bomb_was_pressed = True
 
                 if not self.wait_for_bomb_release \
                         and self.bombs_left >= 1 \
-                        and not game_map.tile_has_bomb(self.position) \
+                        and not game_map.tile_has_bomb(self.get_tile_position()) \
                         and not self.disease == Player.DISEASE_NO_BOMB:
                     self.putting_bomb = True
 
@@ -2871,10 +3322,12 @@ class Player(Positionable):
                 special_was_pressed = True
 
                 if not self.wait_for_special_release:
-                    while len(self.detonator_bombs) != 0:
-                        # find a bomb to detonate (some may have exploded by themselves already)
-                        self.info_board_update_needed = True
+                    if len(self.detonator_bombs) != 0:
+                        self.info_board_update_needed = True  # at least one bomb leaves the list below
 
+                    while len(self.detonator_bombs) != 0:
+                        # find a bomb to detonate (some may have exploded by themselves already), popping from the
+                        # end is cheap and drops the stale ones on the way
                         bomb_to_check = self.detonator_bombs.pop()
 
                         if bomb_to_check.has_detonator() and not bomb_to_check.has_exploded and bomb_to_check.movement != Bomb.BOMB_FLYING:
@@ -2886,6 +3339,9 @@ class Player(Positionable):
                     if not detonator_triggered and self.has_boxing_glove:
                         self.boxing = True
 
+        if not first_step:
+            return
+
         if moved:
             game_map.add_sound_event(SoundPlayer.SOUND_EVENT_WALK)
 
@@ -2897,48 +3353,43 @@ class Player(Positionable):
 
     # ----------------------------------------------------------------------------
 
-    def __manage_kick_box(self, game_map: GameMap, collision_happened: bool) -> None:
+    def __manage_kick_box(self, game_map: GameMap, collision_happened: bool, first_step: bool) -> None:
         """
 
         Parameters
         ----------
         game_map : GameMap
         collision_happened : bool
+        first_step : bool
+            boxing only happens in the first sub-step of a frame, kicking in any of them
         """
-        if collision_happened:
-            bomb_movement = Bomb.BOMB_NO_MOVEMENT
+        if not collision_happened or not (self.has_shoe or self.has_boxing_glove):
+            return  # the cheap flag tests first, the forward tile is only needed with a shoe or a glove
 
-            possible_movement = {
-                Player.STATE_WALKING_UP: Bomb.BOMB_ROLLING_UP,
-                Player.STATE_WALKING_RIGHT: Bomb.BOMB_ROLLING_RIGHT,
-                Player.STATE_WALKING_DOWN: Bomb.BOMB_ROLLING_DOWN,
-                Player.STATE_WALKING_LEFT: Bomb.BOMB_ROLLING_LEFT
-            }
+        forward_tile = self.get_forward_tile_position()
+        bomb_hit = game_map.bomb_on_tile(forward_tile)
 
-            if self.state in possible_movement.keys():
-                bomb_movement = possible_movement[self.state]
-
-            direction_vector = self.get_direction_vector()
-            forward_tile = self.get_forward_tile_position()
+        if bomb_hit is None:
+            return
 
-            if (self.has_shoe or self.has_boxing_glove) and game_map.tile_has_bomb(forward_tile):
-                # kick or box happens
-                bomb_hit = game_map.bomb_on_tile(forward_tile)
+        # kick or box happens
+        if self.boxing:
+            if first_step:  # one box per frame, even on a frame split into sub-steps
+                bomb_hit.send_flying(forward_tile + (self.get_direction_vector() * 3))
+                game_map.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
+        elif self.has_shoe:
+            bomb_movement = Bomb.KICK_MOVEMENTS[self.state]
 
-                if self.boxing:
-                    bomb_hit.send_flying(forward_tile + (direction_vector * 3))
-                    game_map.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
-                elif self.has_shoe:
-                    # align the bomb in case of kicking an already moving bomb
-                    bomb_position = bomb_hit.get_position()
+            # align the bomb in case of kicking an already moving bomb
+            bomb_position = bomb_hit.get_position()
 
-                    if bomb_movement in (Bomb.BOMB_ROLLING_LEFT, Bomb.BOMB_ROLLING_RIGHT):
-                        bomb_hit.set_position(Coordinate(math.floor(bomb_position.get_col()) + 0.5, bomb_position.get_row()))
-                    else:
-                        bomb_hit.set_position(Coordinate(math.floor(bomb_position.get_col()), bomb_position.get_row() + 0.5))
+            if bomb_movement in (Bomb.BOMB_ROLLING_LEFT, Bomb.BOMB_ROLLING_RIGHT):
+                bomb_hit.set_position(Coordinate(bomb_position.get_col(), math.floor(bomb_position.get_row()) + 0.5))
+            else:
+                bomb_hit.set_position(Coordinate(math.floor(bomb_position.get_col()) + 0.5, bomb_position.get_row()))
 
-                    bomb_hit.movement = bomb_movement
-                    game_map.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
+            bomb_hit.movement = bomb_movement
+            game_map.add_sound_event(SoundPlayer.SOUND_EVENT_KICK)
 
     # ----------------------------------------------------------------------------
 
@@ -2956,67 +3407,74 @@ class Player(Positionable):
         bool
         """
         collision_type = game_map.get_position_collision_type(self.position)
+
+        if collision_type == GameMap.COLLISION_NONE:
+            return False  # the usual case, nothing to resolve
+
         collision_happened = False
 
         if collision_type == GameMap.COLLISION_TOTAL:
-            self.position = previous_position
+            self.set_position(previous_position)
             collision_happened = True
         else:
-            helper_mapping = {
-                GameMap.COLLISION_BORDER_UP: (
-                    Player.STATE_WALKING_UP,
-                    [Player.STATE_WALKING_LEFT, Player.STATE_WALKING_RIGHT],
-                    Coordinate(distance_to_travel, 0.0)
-                ),
-                GameMap.COLLISION_BORDER_DOWN: (
-                    Player.STATE_WALKING_DOWN,
-                    [Player.STATE_WALKING_LEFT, Player.STATE_WALKING_RIGHT],
-                    Coordinate(-1 * distance_to_travel, 0.0)
-                ),
-                GameMap.COLLISION_BORDER_RIGHT: (
-                    Player.STATE_WALKING_RIGHT,
-                    [Player.STATE_WALKING_UP, Player.STATE_WALKING_DOWN],
-                    Coordinate(0.0, - 1 * distance_to_travel)
-                ),
-                GameMap.COLLISION_BORDER_LEFT: (
-                    Player.STATE_WALKING_LEFT,
-                    [Player.STATE_WALKING_UP, Player.STATE_WALKING_DOWN],
-                    Coordinate(0.0, distance_to_travel)
-                )
-            }
+            response = Player.BORDER_COLLISION_RESPONSES.get((collision_type, self.state))
 
-            if collision_type in helper_mapping:
-                helper_values = helper_mapping[collision_type]
-
-                if self.state == helper_values[0]:  # walking against the border won't allow player to pass
-                    self.position = previous_position
-                    collision_happened = True
-                elif self.state in helper_values[1]:  # walking along the border will shift the player sideways
-                    self.position += helper_values[2]
+            if response == ():  # walking against the border won't allow player to pass
+                self.set_position(previous_position)
+                collision_happened = True
+            elif response is not None:  # walking along the border will shift the player sideways
+                shift_col, shift_row = response
+                self.set_position(Coordinate(self.position.col + shift_col * distance_to_travel,
+                                             self.position.row + shift_row * distance_to_travel))
 
         return collision_happened
 
     # ----------------------------------------------------------------------------
 
-    def react_to_inputs(self, input_actions: list, dt: int, game_map: GameMap) -> None:
+    def react_to_inputs_in_steps(self, input_actions: list, dt: int, game_map: GameMap) -> None:
+        """
+        Like react_to_inputs(), but a frame longer than Player.MAX_STEP_TIME is split into nearly equal sub-steps so
+        that the player doesn't skip collisions. Only the movement is repeated in each sub-step, the one-shot
+        actions (laying, throwing and detonating bombs, boxing and their sounds) are handled once per frame. Kicking
+        a bomb with the shoe comes from running into it, so like the movement it can happen in any sub-step.
+
+        Parameters
+        ----------
+        input_actions : list[PlayerActions]
+        dt : int
+        game_map : GameMap
+        """
+        step_count = max(1, -(-dt // Player.MAX_STEP_TIME))
+
+        for i in range(step_count):
+            step_dt = dt // step_count + (1 if i < dt % step_count else 0)
+            self.react_to_inputs(input_actions, step_dt, game_map, i == 0)
+
+    # ----------------------------------------------------------------------------
+
+    def react_to_inputs(self, input_actions: list, dt: int, game_map: GameMap, first_step: bool = True) -> None:
         """
         Sets the state and other attributes like position etc. of this player accoording to a list of input action
-        (returned by PlayerKeyMaps.get_current_actions()).
+        (returned by PlayerKeyMaps.get_current_actions()). Actions of other players are skipped, so the list can
+        be shared by all players, but passing just this player's actions saves going through the others.
 
         Parameters
         ----------
         input_actions : list[PlayerActions]
         dt : int
         game_map : GameMap
+        first_step : bool
+            False for the later sub-steps of a frame, these only move the player, see react_to_inputs_in_steps()
         """
         if self.state == Player.STATE_DEAD or game_map.get_state() == GameMap.STATE_WAITING_TO_PLAY:
             return
 
-        if self.state in [Player.STATE_IN_AIR, Player.STATE_TELEPORTING]:
+        airborne_duration = Player.AIRBORNE_DURATIONS.get(self.state)
+
+        if airborne_duration is not None:  # one lookup answers both "is airborne" and "for how long"
             self.state_time += dt
 
-            if self.state_time >= (
-            Player.JUMP_DURATION if self.state == Player.STATE_IN_AIR else Player.TELEPORT_DURATION):
+            if self.state_time >= airborne_duration:
                 self.state = self.state_backup
                 self.state_time = 0
                 self.jumping_to = None
@@ -3028,58 +3486,51 @@ class Player(Positionable):
 
         distance_to_travel = dt / 1000.0 * current_speed
 
-        self.throwing_time_left = max(0, self.throwing_time_left - dt)
+        if self.throwing_time_left > 0:  # only counts down for a while after a throw
+            self.throwing_time_left = 0 if self.throwing_time_left <= dt else self.throwing_time_left - dt
 
         old_state = self.state
 
-        if self.state in (Player.STATE_WALKING_UP, Player.STATE_IDLE_UP):
-            self.state = Player.STATE_IDLE_UP
-        elif self.state in (Player.STATE_WALKING_RIGHT, Player.STATE_IDLE_RIGHT):
-            self.state = Player.STATE_IDLE_RIGHT
-        elif self.state in (Player.STATE_WALKING_DOWN, Player.STATE_IDLE_DOWN):
-            self.state = Player.STATE_IDLE_DOWN
-        else:
-            self.state = Player.STATE_IDLE_LEFT
+        self.state = Player.STATE_DIRECTION_NUMBERS[self.state]  # idle states are numbered like the directions
 
-        previous_position = Coordinate(*self.position.get_tuple())  # in case of collision we save the previous position
+        previous_position = self.position  # in case of collision, positions are replaced and never mutated so no copy is needed
+        previous_tile = self.get_tile_position()  # cached with the position, no need to compute it from the old one later
 
-        self.putting_bomb = False
-        self.putting_multibomb = False
-        self.throwing = False
-        self.boxing = False
+        if first_step:  # the later sub-steps keep these for the renderer, but don't act on them again
+            self.putting_bomb = False
+            self.putting_multibomb = False
+            self.throwing = False
+            self.boxing = False
 
-        if self.disease == Player.DISEASE_DIARRHEA:
-            input_actions.append(PlayerActions(self.number, PlayerKeyMaps.ACTION_BOMB))  # inject bomb put event
+        if first_step and self.disease == Player.DISEASE_DIARRHEA:
+            input_actions = input_actions + [self.diarrhea_action]  # inject bomb put event, the caller's list stays
 
-        self.__manage_input_actions(input_actions, game_map, distance_to_travel)
+        self.__manage_input_actions(input_actions, game_map, distance_to_travel, first_step)
 
         # resolve collisions:
         check_collisions = True
 
         current_tile = self.get_tile_position()
-        previous_tile = Positionable.position_to_tile(previous_position)
         transitioning_tiles = current_tile != previous_tile
 
         if transitioning_tiles:
             self.wait_for_tile_transition = False
-
-        if game_map.tile_has_bomb(current_tile):  # first check if the player is standing on a bomb
-            if not transitioning_tiles:
-                check_collisions = False  # no transition between tiles -> let the player move
+        elif game_map.tile_has_bomb(current_tile):  # standing on a bomb without a transition between tiles
+            check_collisions = False  # -> let the player move
 
         collision_happened = False
 
-        if check_collisions:
+        if check_collisions and self.position is not previous_position:  # standing still, nothing to run into
             collision_happened = self.__resolve_collisions(game_map, distance_to_travel, previous_position)
 
-        if self.putting_bomb and not game_map.tile_has_bomb(
-                self.get_tile_position()) and not game_map.tile_has_teleport(self.position):
+        if first_step and self.putting_bomb and not game_map.tile_has_bomb(
+                self.get_tile_position()) and not game_map.tile_has_teleport(self.get_tile_position()):
             self.lay_bomb(game_map)
 
         # check if bomb kick or box happens
-        self.__manage_kick_box(game_map, collision_happened)
+        self.__manage_kick_box(game_map, collision_happened, first_step)
 
-        if self.throwing:
+        if first_step and self.throwing:
             bomb_thrown = game_map.bomb_on_tile(current_tile)
             game_map.add_sound_event(SoundPlayer.SOUND_EVENT_THROW)
 
@@ -3090,32 +3541,22 @@ class Player(Positionable):
                 self.wait_for_bomb_release = True
                 self.throwing_time_left = 200
 
-        elif self.putting_multibomb:  # put multibomb
-            current_tile = self.get_tile_position()
-
-            if self.state in (Player.STATE_WALKING_UP, Player.STATE_IDLE_UP):
-                tile_increment = Position(0, -1)
-            elif self.state in (Player.STATE_WALKING_RIGHT, Player.STATE_IDLE_RIGHT):
-                tile_increment = Position(1, 0)
-            elif self.state in (Player.STATE_WALKING_DOWN, Player.STATE_IDLE_DOWN):
-                tile_increment = Position(0, 1)
-            else:  # left
-                tile_increment = Position(-1, 0)
-
-            i = 1
-
-            while self.bombs_left > 0:
-                next_tile = current_tile + (tile_increment * i)
-                if not game_map.tile_is_walkable(next_tile) or game_map.tile_has_player(next_tile):
-                    break
+        elif first_step and self.putting_multibomb:  # put multibomb
+            # find the whole free run first, the new bombs only block tiles already passed by the scan
+            start_tile = self.get_tile_position()  # collisions may have moved the player since
+            direction_vector = self.get_direction_vector()
+            bomb_count = game_map.count_free_tiles_in_line(start_tile, direction_vector, self.bombs_left)
 
-                self.lay_bomb(game_map, next_tile)
-                i += 1
+            for distance in range(1, bomb_count + 1):
+                self.lay_bomb(game_map, Position(
+                    start_tile.col + distance * direction_vector.col,
+                    start_tile.row + distance * direction_vector.row
+                ))
 
         # check disease
 
         if self.disease != Player.DISEASE_NONE:
-            self.disease_time_left = max(0, self.disease_time_left - dt)
+            self.disease_time_left = 0 if self.disease_time_left <= dt else self.disease_time_left - dt
 
             if self.disease_time_left == 0:
                 self.disease = Player.DISEASE_NONE
@@ -3143,6 +3584,8 @@ class BombFlightInfo:
         in which direction the bomb is flying (or which axis will be incremented/decremented), 0, 1 or -1
     """
 
+    __slots__ = ('total_distance_to_travel', 'distance_travelled', 'direction')
+
     def __init__(self):
         self.total_distance_to_travel = 0  ##< in tiles
         self.distance_travelled = 0  ##< in tiles
@@ -3172,11 +3615,21 @@ class Bomb(Positionable):
     movement : int
     has_exploded : bool
     flight_info : BombFlightInfo
+    game_map : GameMap or None
+        map the bomb was put on, notified about bomb's tile changes
+    indexed_tile : tuple[int, int] or None
+        under which tile the map keeps the bomb in its bombs_by_tile index
     """
 
     ROLLING_SPEED = 4
     FLYING_SPEED = 5
 
+    # bombs are created and updated in big numbers, keep them compact
+    __slots__ = (
+        'game_map', 'indexed_tile', 'time_of_existence', 'flame_length', 'player', 'explodes_in', 'detonator_time',
+        'has_spring', '_movement', 'has_exploded', 'flight_info'
+    )
+
     BOMB_ROLLING_UP = 0
     BOMB_ROLLING_RIGHT = 1
     BOMB_ROLLING_DOWN = 2
@@ -3184,6 +3637,26 @@ class Bomb(Positionable):
     BOMB_FLYING = 4
     BOMB_NO_MOVEMENT = 5
 
+    ROLLING_DIRECTIONS = {  ##< rolling movement -> (col step, row step, opposite movement)
+        BOMB_ROLLING_UP: (0, -1, BOMB_ROLLING_DOWN),
+        BOMB_ROLLING_RIGHT: (1, 0, BOMB_ROLLING_LEFT),
+        BOMB_ROLLING_DOWN: (0, 1, BOMB_ROLLING_UP),
+        BOMB_ROLLING_LEFT: (-1, 0, BOMB_ROLLING_RIGHT)
+    }
+
+    ARROW_DIRECTIONS = {  ##< arrow special object -> rolling movement it redirects bombs to
+        MapTile.SPECIAL_OBJECT_ARROW_UP: BOMB_ROLLING_UP,
+        MapTile.SPECIAL_OBJECT_ARROW_RIGHT: BOMB_ROLLING_RIGHT,
+        MapTile.SPECIAL_OBJECT_ARROW_DOWN: BOMB_ROLLING_DOWN,
+        MapTile.SPECIAL_OBJECT_ARROW_LEFT: BOMB_ROLLING_LEFT
+    }
+
+    KICK_MOVEMENTS = (  ##< movement of a bomb kicked by a player, indexed by the player's state
+        (BOMB_NO_MOVEMENT,) * 4  # idle
+        + (BOMB_ROLLING_UP, BOMB_ROLLING_RIGHT, BOMB_ROLLING_DOWN, BOMB_ROLLING_LEFT)  # walking
+        + (BOMB_NO_MOVEMENT,) * 3  # in air, teleporting, dead
+    )
+
     DETONATOR_EXPIRATION_TIME = 20000
 
     BOMB_EXPLODES_IN = 3000
@@ -3192,6 +3665,8 @@ class Bomb(Positionable):
     # ----------------------------------------------------------------------------
 
     def __init__(self, player: Player):
+        self.game_map = None  ##< set by GameMap.add_bomb()
+        self.indexed_tile = None
         super().__init__()
         self.time_of_existence = 0  ##< for how long (in ms) the bomb has existed
         self.flame_length = player.get_flame_length()  ##< how far the flame will go
@@ -3217,21 +3692,43 @@ class Bomb(Positionable):
         """
         self.movement = Bomb.BOMB_FLYING
 
-        current_tile = self.get_tile_position().get_tuple()
-        destination_tile_coords = destination_tile_coords.get_tuple()
+        current_tile = self.get_tile_position()
+        destination_col = destination_tile_coords.col
+        destination_row = destination_tile_coords.row
         self.flight_info.distance_travelled = 0
 
-        axis = 1 if current_tile[0] == destination_tile_coords[0] else 0
+        # plain scalars all the way, the direction and the landing tile are interned positions; the signs are
+        # computed arithmetically as (a > b) - (a < b), which is -1, 0 or 1
+        col_sign = (destination_col > current_tile.col) - (destination_col < current_tile.col)
 
-        self.flight_info.total_distance_to_travel = abs(current_tile[axis] - destination_tile_coords[axis])
-        direction = [0, 0]
-        direction[axis] = -1 if current_tile[axis] > destination_tile_coords[axis] else 1
-        self.flight_info.direction.from_tuple(tuple(direction))
+        if col_sign != 0:
+            self.flight_info.total_distance_to_travel = abs(current_tile.col - destination_col)
+            self.flight_info.direction = Position(col_sign, 0)
+        else:  # flying along the rows, a flight to the very same tile goes on downwards if it can't land
+            row_sign = (destination_row > current_tile.row) - (destination_row < current_tile.row)
+            self.flight_info.total_distance_to_travel = abs(current_tile.row - destination_row)
+            self.flight_info.direction = Position(0, row_sign or 1)
 
-        self.move_to_tile_center(Coordinate(
-            destination_tile_coords[0] % GameMap.MAP_SIZE.get_col(),
-            destination_tile_coords[1] % GameMap.MAP_SIZE.get_row()
-        ))
+        self.move_to_tile_center(Position(destination_col % GameMap.MAP_WIDTH, destination_row % GameMap.MAP_HEIGHT))
+
+    # ----------------------------------------------------------------------------
+
+    @property
+    def movement(self) -> int:
+        return self._movement
+
+    @movement.setter
+    def movement(self, movement: int) -> None:
+        self._movement = movement
+
+        if self.game_map is not None:
+            self.game_map.update_bomb_tile(self)
+
+    # ----------------------------------------------------------------------------
+
+    def position_changed(self) -> None:
+        if self.game_map is not None:
+            self.game_map.update_bomb_tile(self)
 
     # ----------------------------------------------------------------------------
 
@@ -3252,10 +3749,21 @@ class Bomb(Positionable):
 
     # ----------------------------------------------------------------------------
 
-    def explodes(self) -> None:
-        if not self.has_exploded:
-            self.player.bomb_exploded()
-            self.has_exploded = True
+    def explodes(self) -> bool:
+        """
+        Marks the bomb exploded and gives it back to its player, only the first call counts.
+
+        Return
+        ------
+        bool
+            True if the bomb exploded by this call
+        """
+        if self.has_exploded:
+            return False
+
+        self.has_exploded = True
+        self.player.bomb_exploded()
+        return True
 
 
 # ==============================================================================
@@ -3275,6 +3783,8 @@ class Flame:
         string representation of the flame direction
     """
 
+    __slots__ = ('player', 'time_to_burnout', 'direction')
+
     # ----------------------------------------------------------------------------
 
     def __init__(self):
@@ -3282,6 +3792,18 @@ class Flame:
         self.time_to_burnout = 1000  ##< time in ms till the flame disappears
         self.direction = "all"  ##< string representation of the flame direction
 
+    def clone(self):
+        """
+        Return
+        ------
+        Flame
+        """
+        flame = Flame.__new__(Flame)  # all attributes are copied, no need to set defaults first
+        flame.player = self.player
+        flame.time_to_burnout = self.time_to_burnout
+        flame.direction = self.direction
+        return flame
+
 
 # ==============================================================================
 
@@ -3303,9 +3825,27 @@ class StringSerializable:
     # ----------------------------------------------------------------------------
 
     def save_to_file(self, filename: str) -> None:
-        text_file = open(filename, "w")
-        text_file.write(self.save_to_string())
-        text_file.close()
+        """
+        Saves the string form in one write to a temporary file that then replaces the target, so an interrupted
+        save never leaves a half written file behind. If the save fails, the temporary file is removed and the error
+        is raised again.
+
+        Parameters
+        ----------
+        filename : str
+        """
+        temporary_filename = filename + ".tmp"
+
+        try:
+            with open(temporary_filename, "w") as text_file:
+                text_file.write(self.save_to_string())
+
+            os.replace(temporary_filename, filename)
+        except BaseException:
+            if os.path.exists(temporary_filename):
+                os.remove(temporary_filename)  # the target is untouched, don't leave the temporary file behind either
+
+            raise
 
     # ----------------------------------------------------------------------------
 
@@ -3386,6 +3926,20 @@ class PlayerKeyMaps(StringSerializable):
         MOUSE_CONTROL_BUTTON_R: "m R"
     }
 
+    MOVEMENT_ACTIONS = {  ##< movement action -> (col step, row step, walking state of the player)
+        ACTION_UP: (0.0, -1.0, Player.STATE_WALKING_UP),
+        ACTION_RIGHT: (1.0, 0.0, Player.STATE_WALKING_RIGHT),
+        ACTION_DOWN: (0.0, 1.0, Player.STATE_WALKING_DOWN),
+        ACTION_LEFT: (-1.0, 0.0, Player.STATE_WALKING_LEFT)
+    }
+
+    OPPOSITE_ACTIONS = {  ##< movement action -> the opposite one, other actions have no opposite
+        ACTION_UP: ACTION_DOWN,
+        ACTION_RIGHT: ACTION_LEFT,
+        ACTION_DOWN: ACTION_UP,
+        ACTION_LEFT: ACTION_RIGHT
+    }
+
     MOUSE_CONTROL_SMOOTH_OUT_TIME = 50
 
     # ----------------------------------------------------------------------------
@@ -3581,16 +4135,7 @@ class PlayerKeyMaps(StringSerializable):
 
     @staticmethod
     def get_opposite_action(action: int) -> int:
-        if action == PlayerKeyMaps.ACTION_UP:
-            return PlayerKeyMaps.ACTION_DOWN
-        elif action == PlayerKeyMaps.ACTION_RIGHT:
-            return PlayerKeyMaps.ACTION_LEFT
-        elif action == PlayerKeyMaps.ACTION_DOWN:
-            return PlayerKeyMaps.ACTION_UP
-        elif action == PlayerKeyMaps.ACTION_LEFT:
-            return PlayerKeyMaps.ACTION_RIGHT
-
-        return action
+        return PlayerKeyMaps.OPPOSITE_ACTIONS.get(action, action)
 
     # ----------------------------------------------------------------------------
 
@@ -3920,6 +4465,17 @@ class SoundPlayer:
     SOUND_EVENT_EARTHQUAKE = 25
     SOUND_EVENT_CONFIRM = 26
 
+    DISEASE_SOUND_EVENTS = {  ##< sound made on catching each of Player.DISEASE_CHOICES
+        Player.DISEASE_SHORT_FLAME: SOUND_EVENT_DISEASE,
+        Player.DISEASE_SLOW: SOUND_EVENT_SLOW,
+        Player.DISEASE_DIARRHEA: SOUND_EVENT_DIARRHEA,
+        Player.DISEASE_FAST_BOMB: SOUND_EVENT_DISEASE,
+        Player.DISEASE_REVERSE_CONTROLS: SOUND_EVENT_DISEASE,
+        Player.DISEASE_SWITCH_PLAYERS: SOUND_EVENT_DISEASE,
+        Player.DISEASE_NO_BOMB: SOUND_EVENT_DISEASE,
+        Player.DISEASE_EARTHQUAKE: SOUND_EVENT_EARTHQUAKE
+    }
+
     # ----------------------------------------------------------------------------
 
     def __init__(self):
@@ -5091,6 +5647,13 @@ class Renderer:
     ANIMATION_EVENT_DISEASE_CLOUD = 3
     ANIMATION_EVENT_DIE = 4
 
+    DEATH_ANIMATION_EVENTS = (  ##< animations a player's death is randomly shown with
+        ANIMATION_EVENT_DIE,
+        ANIMATION_EVENT_EXPLOSION,
+        ANIMATION_EVENT_RIP,
+        ANIMATION_EVENT_SKELETION
+    )
+
     FONT_SMALL_SIZE = 12
     FONT_NORMAL_SIZE = 25
     MENU_LINE_SPACING = 10
@@ -6024,15 +6587,15 @@ class Renderer:
 
             map_info_border_size = 5
 
-            self.preview_map_image = pygame.Surface((tile_size * GameMap.MAP_SIZE.get_col(),
-                                                     tile_size * GameMap.MAP_SIZE.get_row() + map_info_border_size + Renderer.MAP_TILE_SIZE.get_row()))
+            self.preview_map_image = pygame.Surface((tile_size * GameMap.MAP_WIDTH,
+                                                     tile_size * GameMap.MAP_HEIGHT + map_info_border_size + Renderer.MAP_TILE_SIZE.get_row()))
 
             with open(os.path.join(Game.MAP_PATH, map_filename)) as map_file:
                 map_data = map_file.read()
                 temp_map = GameMap(map_data, PlaySetup(), GameInfo())
 
-                for y in range(GameMap.MAP_SIZE.get_row()):
-                    for x in range(GameMap.MAP_SIZE.get_col()):
+                for y in range(GameMap.MAP_HEIGHT):
+                    for x in range(GameMap.MAP_WIDTH):
                         tile = temp_map.get_tile_at(Position(x, y))
                         tile_kind = tile.kind
 
@@ -6081,7 +6644,7 @@ class Renderer:
                         tile_half_size
                     )
 
-                y = tile_size * GameMap.MAP_SIZE.get_row() + map_info_border_size
+                y = tile_size * GameMap.MAP_HEIGHT + map_info_border_size
                 column = 0
 
                 self.preview_map_image.blit(self.environment_images[temp_map.get_environment_name()][0], (0, y))
@@ -6143,8 +6706,8 @@ class Renderer:
 
         self.prerendered_map_background.blit(image_background, (0, 0))
 
-        for j in range(GameMap.MAP_SIZE.get_row()):
-            for i in range(GameMap.MAP_SIZE.get_col()):
+        for j in range(GameMap.MAP_HEIGHT):
+            for i in range(GameMap.MAP_WIDTH):
                 render_position = (i * Renderer.MAP_TILE_SIZE.get_col() + Renderer.MAP_BORDER_WIDTH,
                                    j * Renderer.MAP_TILE_SIZE.get_row() + Renderer.MAP_BORDER_WIDTH)
                 self.prerendered_map_background.blit(self.environment_images[map_to_render.get_environment_name()][0],
@@ -6227,7 +6790,7 @@ class Renderer:
 
             relative_offset = Coordinate(
                 -1 * (image_to_render.get_size()[0] / 2 - Renderer.PLAYER_SPRITE_CENTER.get_col()),  # offset caused by scale
-                -1 * int(math.sin(quotient * math.pi / 2.0) * Renderer.MAP_TILE_SIZE.get_row() * GameMap.MAP_SIZE.get_row())  # height offset
+                -1 * int(math.sin(quotient * math.pi / 2.0) * Renderer.MAP_TILE_SIZE.get_row() * GameMap.MAP_HEIGHT)  # height offset
             )
 
         elif player.is_teleporting():
@@ -6358,7 +6921,7 @@ class Renderer:
         flame_animation_frame = int((pygame.time.get_ticks() / 100) % 2)
 
         for line in tiles:
-            x = (GameMap.MAP_SIZE.get_col() - 1) * Renderer.MAP_TILE_SIZE.get_col() + Renderer.MAP_BORDER_WIDTH + \
+            x = (GameMap.MAP_WIDTH - 1) * Renderer.MAP_TILE_SIZE.get_col() + Renderer.MAP_BORDER_WIDTH + \
                 self.map_render_location.get_col()
 
             while True:  # render players and bombs in the current line
@@ -6412,7 +6975,7 @@ class Renderer:
                     elif tile.item is not None:
                         result.blit(self.item_images[tile.item], (x, y))
 
-                if len(tile.flames) != 0:  # if there is at least one flame, draw it
+                if tile.flame_count != 0:  # if there is at least one flame, draw it
                     sprite_name = tile.flames[0].direction
                     result.blit(self.flame_images[flame_animation_frame][sprite_name], (x, y))
 
@@ -6423,7 +6986,7 @@ class Renderer:
 
                 profiler.measure_stop("map rend. tiles")
 
-            x = (GameMap.MAP_SIZE.get_col() - 1) * Renderer.MAP_TILE_SIZE.get_col() + Renderer.MAP_BORDER_WIDTH + self.map_render_location.get_col()
+            x = (GameMap.MAP_WIDTH - 1) * Renderer.MAP_TILE_SIZE.get_col() + Renderer.MAP_BORDER_WIDTH + self.map_render_location.get_col()
 
             y += Renderer.MAP_TILE_SIZE.get_row()
             line_number += 1
@@ -6446,11 +7009,11 @@ class Renderer:
         x = self.map_render_location.get_col() + 12
         y = self.map_render_location.get_row() + self.prerendered_map_background.get_size()[1] + 20
 
-        for i in players_by_numbers:
-            if players_by_numbers[i] is None or self.player_info_board_images[i] is None:
+        for i, player in enumerate(players_by_numbers):
+            if player is None or self.player_info_board_images[i] is None:
                 continue
 
-            if players_by_numbers[i].is_dead():
+            if player.is_dead():
                 movement_offset = (0, 0)
             else:
                 movement_offset = (int(math.sin(pygame.time.get_ticks() / 64.0 + i) * 2),
@@ -6696,7 +7259,7 @@ class AI:
         """
         count = 0
 
-        for tile_offset in (Position(0, -1), Position(1, 0), Position(0, 1), Position(-1, 0)):  # for each neigbour file
+        for tile_offset in Player.DIRECTION_VECTORS:  # for each neigbour file
             helper_tile = self.game_map.get_tile_at(tile_coordinates + tile_offset)
 
             if (helper_tile is not None) and (helper_tile.kind == MapTile.TILE_BLOCK):
@@ -6799,8 +7362,7 @@ class AI:
 
             general_direction = self.decide_general_direction()
 
-            # up                     # right                     # down                     # left
-            tile_increment = (Position(0, -1), Position(1, 0), Position(0, 1), Position(-1, 0))
+            tile_increment = Player.DIRECTION_VECTORS  # up, right, down, left
             action = (PlayerKeyMaps.ACTION_UP, PlayerKeyMaps.ACTION_RIGHT, PlayerKeyMaps.ACTION_DOWN, PlayerKeyMaps.ACTION_LEFT)
 
             # should I move up, right, down or left?
@@ -6862,7 +7424,7 @@ class AI:
                 chance_to_put_bomb = 5
             else:
                 block_tile_ratio = self.game_map.get_number_of_block_tiles() / float(
-                    GameMap.MAP_SIZE.get_col() * GameMap.MAP_SIZE.get_row())
+                    GameMap.MAP_WIDTH * GameMap.MAP_HEIGHT)
 
                 if block_tile_ratio < 0.4:  # if there is not many tiles left, put bombs more often
                     chance_to_put_bomb = 80
@@ -7516,7 +8078,7 @@ class Game:
 
                 for i in range(len(player_slots)):
                     if player_slots[i] is not None and player_slots[i].get_player_number() < 0:  # indicates AI
-                        self.ais.append(AI(self.game_map.get_players_by_numbers()[i], self.game_map))
+                        self.ais.append(AI(self.game_map.get_player(i), self.game_map))
 
                 for player in self.game_map.get_players():
                     player.set_kills(kill_counts[player.get_number()])
@@ -7606,8 +8168,15 @@ class Game:
 
         profiler.measure_start("sim. inputs")
 
-        for player in players:
-            player.react_to_inputs(actions_being_performed, dt, self.game_map)
+        # hand each player only its own actions, instead of every player going through all of them
+        actions_by_player = {player.get_number(): [] for player in players}
+
+        for action in actions_being_performed:
+            if action.player in actions_by_player:
+                actions_by_player[action.player].append(action)
+
+        for player in players:  # on slow frames the players move in several shorter steps
+            player.react_to_inputs_in_steps(actions_by_player[player.get_number()], dt, self.game_map)
 
         profiler.measure_stop("sim. inputs")
 
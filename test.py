@@ -6,6 +6,7 @@
 import bombman
 import pygame
 import os
+import tempfile
 
 """
 
@@ -35,6 +36,26 @@ def assertion(message: str, condition):
         errors_total += 1
 
 
+def create_playing_map(map_name: str = "classic") -> bombman.GameMap:
+    """
+    Loads a map with the default play setup and lets it get past the waiting before the game
+
+    Parameters
+    ----------
+    map_name : str
+
+    Return
+    ------
+    bombman.GameMap
+    """
+    with open(os.path.join(bombman.Game.MAP_PATH, map_name)) as map_file:
+        new_map = bombman.GameMap(map_file.read(), bombman.PlaySetup(), bombman.GameInfo())
+
+    new_map.update(bombman.GameMap.START_GAME_AFTER + 100)
+    new_map.get_and_clear_sound_events()
+    return new_map
+
+
 #       ======================
 #       play a small test game
 #       ======================
@@ -122,6 +143,16 @@ assertion("right item count for ITEM_SPEEDUP", player3.get_item_count(bombman.Ga
 assertion("right item count for ITEM_SHOE", player3.get_item_count(bombman.GameMap.ITEM_SHOE) == 0)
 assertion("total number of items", len(player3.get_items()) == 7)
 
+items_player = bombman.Player()
+items_player.give_item(bombman.GameMap.ITEM_SHOE)
+items_player.give_item(bombman.GameMap.ITEM_BOMB)
+items_player.give_item(bombman.GameMap.ITEM_SPEEDUP)
+items_player.give_item(test_map.letter_to_item("?"))  # unknown letter
+assertion("items are listed in the order they were first got", items_player.get_items() == (
+    bombman.GameMap.ITEM_BOMB, bombman.GameMap.ITEM_BOMB, bombman.GameMap.ITEM_FLAME, bombman.GameMap.ITEM_SHOE,
+    bombman.GameMap.ITEM_SPEEDUP))
+assertion("no count for an unknown item", items_player.get_item_count(test_map.letter_to_item("?")) == 0)
+
 tile = bombman.Position(0, 0)
 assertion("AI - number of blocks next to " + str(tile) + " = 0", ai.number_of_blocks_next_to_tile(tile) == 0)
 tile = bombman.Position(1, 1)
@@ -275,6 +306,298 @@ for i in range(50):
 assertion("map state = STATE_GAME_OVER", test_map.get_state() == bombman.GameMap.STATE_GAME_OVER)
 assertion("map winning team = 3", test_map.get_winner_team() == 3)
 
+#       =========================================
+#       danger values between danger map rebuilds
+#       =========================================
+
+danger_test_map = create_playing_map()
+
+print("lay a bomb with a detonator at (4,3) and a timed bomb at (10,3)")
+danger_test_map.get_players()[1].lay_bomb(danger_test_map, bombman.Position(4, 3))
+detonator_bomb = danger_test_map.bomb_on_tile(bombman.Position(4, 3))
+detonator_bomb.detonator_time = bombman.Bomb.DETONATOR_EXPIRATION_TIME
+danger_test_map.get_players()[2].lay_bomb(danger_test_map, bombman.Position(10, 3))
+
+dt = 250
+map_size = bombman.GameMap.MAP_SIZE
+danger_values_matched = True
+danger_map_rebuilds = 0
+last_danger_map = None
+detonator_expired = False
+
+for i in range(100):  # the timed bomb explodes, then the detonator expires and the other bomb counts down too
+    # the danger values computed from scratch, the way the danger map used to be rebuilt in every frame
+    expected_danger = [[0 if danger_test_map.get_tile_at(bombman.Position(x, y)).should_not_walk()
+                        else bombman.GameMap.SAFE_DANGER_VALUE
+                        for x in range(map_size.get_col())] for y in range(map_size.get_row())]
+
+    for danger_bomb in danger_test_map.get_bombs():
+        bomb_tile = danger_bomb.get_tile_position()
+        time_until_explosion = 100 if danger_bomb.has_detonator() else danger_bomb.time_until_explosion()
+        expected_danger[bomb_tile.get_row()][bomb_tile.get_col()] = min(
+            expected_danger[bomb_tile.get_row()][bomb_tile.get_col()], time_until_explosion)
+
+        for direction in (bombman.Position(0, -1), bombman.Position(1, 0), bombman.Position(0, 1),
+                          bombman.Position(-1, 0)):
+            flame_tile = bomb_tile
+
+            for j in range(danger_bomb.flame_length):
+                flame_tile = flame_tile + direction
+
+                if not danger_test_map.tile_is_walkable(flame_tile):
+                    break
+
+                expected_danger[flame_tile.get_row()][flame_tile.get_col()] = min(
+                    expected_danger[flame_tile.get_row()][flame_tile.get_col()], time_until_explosion)
+
+    danger_values_matched = danger_values_matched and all(
+        danger_test_map.get_danger_value(bombman.Position(x, y)) == expected_danger[y][x]
+        for y in range(map_size.get_row()) for x in range(map_size.get_col()))
+
+    if danger_test_map.danger_map is not last_danger_map:
+        danger_map_rebuilds += 1
+        last_danger_map = danger_test_map.danger_map
+
+    detonator_expired = detonator_expired or (detonator_bomb.detonator_time > 0 and not detonator_bomb.has_detonator())
+    danger_test_map.update(dt)
+
+print("danger map rebuilt " + str(danger_map_rebuilds) + " times in 100 frames")
+assertion("detonator expired during the test", detonator_expired)
+assertion("danger values match the from scratch computation in every frame", danger_values_matched)
+assertion("danger map isn't rebuilt in every frame", danger_map_rebuilds < 50)
+
+#       =============================
+#       slow frames move in sub-steps
+#       =============================
+
+print("walk with diarrhea, throw and box, each in a 100 ms frame and in a 30 ms frame")
+frame_results = {}
+
+for frame_kind in ("diarrhea", "throw", "boxing"):
+    for frame_dt in (100, 30):
+        frame_map = create_playing_map()
+        frame_player = frame_map.get_players()[0]
+
+        if frame_kind == "diarrhea":
+            frame_player.set_disease(bombman.Player.DISEASE_DIARRHEA, bombman.Player.DISEASE_TIME)
+            frame_actions = [bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_RIGHT),
+                             bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_BOMB)]
+        elif frame_kind == "throw":
+            frame_player.give_item(bombman.GameMap.ITEM_THROWING_GLOVE)
+            frame_player.lay_bomb(frame_map)
+            frame_map.get_and_clear_sound_events()
+            frame_actions = [bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_BOMB_DOUBLE)]
+        else:
+            frame_player.give_item(bombman.GameMap.ITEM_BOXING_GLOVE)
+            frame_actions = [bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_SPECIAL)]
+
+        frame_player.react_to_inputs_in_steps(frame_actions, frame_dt, frame_map)
+
+        # bombs laid, sounds made, length of the action list and whether the player is boxing
+        frame_results[(frame_kind, frame_dt)] = (len(frame_map.get_bombs()), frame_map.get_and_clear_sound_events(),
+                                                 len(frame_actions), frame_player.is_boxing())
+
+print("100 ms frames: " + str([frame_results[(frame_kind, 100)] for frame_kind in ("diarrhea", "throw", "boxing")]))
+assertion("walking with diarrhea - 100 ms frame lays the same bombs and makes the same sounds as 30 ms frame",
+          frame_results[("diarrhea", 100)] == frame_results[("diarrhea", 30)])
+assertion("walking with diarrhea - one bomb laid", frame_results[("diarrhea", 100)][0] == 1)
+assertion("walking with diarrhea - action list is not changed", frame_results[("diarrhea", 100)][2] == 2)
+assertion("throwing - 100 ms frame makes the same sounds as 30 ms frame",
+          frame_results[("throw", 100)] == frame_results[("throw", 30)])
+assertion("throwing - one throw sound",
+          frame_results[("throw", 100)][1].count(bombman.SoundPlayer.SOUND_EVENT_THROW) == 1)
+assertion("boxing - 100 ms frame ends like 30 ms frame",
+          frame_results[("boxing", 100)] == frame_results[("boxing", 30)])
+assertion("boxing - player is boxing after the 100 ms frame", frame_results[("boxing", 100)][3])
+
+#       =================================
+#       bomb rolling up after an up arrow
+#       =================================
+
+arrow_map = create_playing_map()
+
+for y in range(7):  # clear a corridor along row 6 and up column 4
+    for x in range(5):
+        if y == 6 or x == 4:
+            arrow_tile = arrow_map.get_tile_at(bombman.Position(x, y))
+            arrow_tile.kind = bombman.MapTile.TILE_FLOOR
+            arrow_tile.item = None
+
+arrow_map.get_tile_at(bombman.Position(4, 6)).special_object = bombman.MapTile.SPECIAL_OBJECT_ARROW_UP
+
+print("roll a bomb right from (1,6) onto an up arrow at (4,6)")
+arrow_map.get_players()[1].lay_bomb(arrow_map, bombman.Position(1, 6))
+rolling_bomb = arrow_map.bomb_on_tile(bombman.Position(1, 6))
+rolling_bomb.explodes_in = 100000  # only the rolling matters here
+rolling_bomb.movement = bombman.Bomb.BOMB_ROLLING_RIGHT
+
+dt = 10
+
+for i in range(200):
+    arrow_map.update(dt)
+
+    if rolling_bomb.movement != bombman.Bomb.BOMB_ROLLING_RIGHT:
+        break
+
+print("bomb redirected at " + str(rolling_bomb.get_position()))
+assertion("bomb rolls up after the arrow", rolling_bomb.movement == bombman.Bomb.BOMB_ROLLING_UP)
+assertion("bomb is aligned with column 4", rolling_bomb.get_position().get_col() == 4.5)
+assertion("bomb keeps its row on the arrow tile, isn't moved to the tile's top edge",
+          6.0 < rolling_bomb.get_position().get_row() <= 6.5)
+
+for i in range(300):
+    arrow_map.update(dt)
+
+    if rolling_bomb.movement == bombman.Bomb.BOMB_NO_MOVEMENT:
+        break
+
+print("bomb stopped at " + str(rolling_bomb.get_position()))
+assertion("bomb rolled up column 4 to the map border", rolling_bomb.get_tile_position() == bombman.Position(4, 0))
+assertion("bomb stopped in the tile center",
+          rolling_bomb.get_position().get_col() == 4.5 and rolling_bomb.get_position().get_row() == 0.5)
+
+#       =======================================
+#       flames burning out and items given away
+#       =======================================
+
+timing_map = create_playing_map()
+flame_tile = timing_map.get_tile_at(bombman.Position(4, 3))
+
+print("put two flames on tile (4,3), burning out in 50 and 200 ms")
+
+for time_to_burnout in (50, 200):
+    new_flame = bombman.Flame()
+    new_flame.time_to_burnout = time_to_burnout
+    flame_tile.add_flame(new_flame)
+
+timing_map.add_burning_tile(flame_tile)
+
+dt = 100
+
+timing_map.update(dt)
+assertion("after 100 ms one flame is left", flame_tile.flame_count == 1)
+timing_map.update(dt)
+assertion("after 200 ms the tile still burns", timing_map.tile_has_flame(flame_tile.coordinates))
+timing_map.update(dt)
+
+# before the flames were aged in one pass, the second flame skipped the frame in which the first one burnt out, so
+# the tile was cleared one frame (here 100 ms) later
+assertion("after 300 ms the tile is cleared", not timing_map.tile_has_flame(flame_tile.coordinates))
+
+print("schedule two item give-aways for the same time")
+give_away_time = timing_map.time_from_start + 150
+timing_map.items_to_give_away.append((give_away_time, [bombman.GameMap.ITEM_BOMB]))
+timing_map.items_to_give_away.append((give_away_time, [bombman.GameMap.ITEM_FLAME]))
+
+timing_map.update(dt)
+assertion("no items given away before their time", len(timing_map.items_to_give_away) == 2)
+timing_map.update(dt)
+
+# before, the entry following a given away one was skipped and given away one frame later
+assertion("both items given away in the same frame", len(timing_map.items_to_give_away) == 0)
+
+#       ===========================
+#       teleporting through a flame
+#       ===========================
+
+teleport_map = create_playing_map()
+teleporting_player = teleport_map.get_players()[0]
+walking_player = teleport_map.get_players()[1]
+
+print("player 0 teleports while its tile burns, player 1 stands in a flame")
+teleporting_player.state = bombman.Player.STATE_TELEPORTING
+teleporting_player.teleporting_to = teleporting_player.get_tile_position()
+
+for burning_player in (teleporting_player, walking_player):
+    new_flame = bombman.Flame()
+    new_flame.player = teleport_map.get_players()[2]  # who gets the kill
+    teleport_map.get_tile_at(burning_player.get_tile_position()).add_flame(new_flame)
+
+teleport_map.update(100)
+
+assertion("teleporting player doesn't die in the flame", not teleporting_player.is_dead())
+assertion("player on the ground dies in the flame", walking_player.is_dead())
+
+#       ========================================
+#       kicked bombs are aligned with their path
+#       ========================================
+
+for bomb_position, action, expected_movement, expected_position in (
+        (bombman.Coordinate(1.5, 0.3), bombman.PlayerKeyMaps.ACTION_RIGHT, bombman.Bomb.BOMB_ROLLING_RIGHT,
+         bombman.Coordinate(1.5, 0.5)),
+        (bombman.Coordinate(0.8, 1.5), bombman.PlayerKeyMaps.ACTION_DOWN, bombman.Bomb.BOMB_ROLLING_DOWN,
+         bombman.Coordinate(0.5, 1.5))):
+    kick_map = create_playing_map()
+    kicking_player = kick_map.get_players()[0]
+    kicking_player.give_item(bombman.GameMap.ITEM_SHOE)
+    kick_map.get_players()[1].lay_bomb(kick_map, bombman.Positionable.position_to_tile(bomb_position))
+    kicked_bomb = kick_map.get_bombs()[0]
+    kicked_bomb.set_position(bomb_position)  # e.g. a bomb that has been rolling across
+
+    print("player 0 walks into a bomb at " + str(bomb_position))
+
+    for i in range(100):
+        kicking_player.react_to_inputs([bombman.PlayerActions(0, action)], 10, kick_map)
+
+        if kicked_bomb.movement != bombman.Bomb.BOMB_NO_MOVEMENT:
+            break
+
+    print("bomb kicked from " + str(kicked_bomb.get_position()))
+    assertion("kicked bomb rolls away from the player", kicked_bomb.movement == expected_movement)
+    assertion("kicked bomb starts from the middle of its row or column",
+              kicked_bomb.get_position().get_col() == expected_position.get_col()
+              and kicked_bomb.get_position().get_row() == expected_position.get_row())
+
+#       ============================
+#       bomb and player tile indexes
+#       ============================
+
+index_map = create_playing_map()
+index_players = index_map.get_players()
+dt = 50
+
+print("player 0 walks right and down, players 1 and 2 lay bombs, player 3 lays a bomb at (10,3) which rolls left"
+      " and the bomb of player 1 is thrown, then the bombs roll, fly, land and explode")
+indexes_matched = True
+bombs_were_flying_or_rolling = False
+
+for i in range(120):
+    if i < 10:
+        index_players[0].react_to_inputs([bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_RIGHT)], dt, index_map)
+    elif i < 20:
+        index_players[0].react_to_inputs([bombman.PlayerActions(0, bombman.PlayerKeyMaps.ACTION_DOWN)], dt, index_map)
+    elif i == 20:
+        index_players[1].lay_bomb(index_map)
+        index_players[2].lay_bomb(index_map)
+        index_players[3].lay_bomb(index_map, bombman.Position(10, 3))
+        index_map.bomb_on_tile(bombman.Position(10, 3)).movement = bombman.Bomb.BOMB_ROLLING_LEFT
+        index_map.bomb_on_tile(index_players[1].get_tile_position()).send_flying(bombman.Position(11, 3))
+
+    # compare the indexes with a scan of all bombs and players
+    expected_bombs = {}
+    expected_players = {}
+
+    for scanned_bomb in index_map.get_bombs():
+        if scanned_bomb.movement != bombman.Bomb.BOMB_FLYING:
+            expected_bombs.setdefault(scanned_bomb.get_tile_position().get_tuple(), set()).add(scanned_bomb)
+
+    for scanned_player in index_players:
+        expected_players.setdefault(scanned_player.get_tile_position().get_tuple(), set()).add(scanned_player)
+
+    indexes_matched = indexes_matched \
+        and {tile: set(bombs) for tile, bombs in index_map.bombs_by_tile.items()} == expected_bombs \
+        and {tile: set(players) for tile, players in index_map.players_by_tile.items()} == expected_players
+    bombs_were_flying_or_rolling = bombs_were_flying_or_rolling or any(
+        moving_bomb.movement in (bombman.Bomb.BOMB_FLYING, bombman.Bomb.BOMB_ROLLING_LEFT)
+        for moving_bomb in index_map.get_bombs())
+
+    index_map.update(dt)
+
+assertion("bombs were rolling and flying", bombs_were_flying_or_rolling)
+assertion("all bombs exploded", len(index_map.get_bombs()) == 0)
+assertion("tile indexes match in every frame", indexes_matched)
+assertion("no bombs left in the bomb index", len(index_map.bombs_by_tile) == 0)
+
 #       =================
 #       test other things
 #       =================
@@ -284,6 +607,19 @@ assertion("ACTION_DOWN is opposite of ACTION_UP", bombman.PlayerKeyMaps.get_oppo
 assertion("ACTION_LEFT is opposite of ACTION_RIGHT", bombman.PlayerKeyMaps.get_opposite_action(
     bombman.PlayerKeyMaps.ACTION_LEFT) == bombman.PlayerKeyMaps.ACTION_RIGHT)
 
+print("save over a directory, which fails")
+failing_target = tempfile.mkdtemp()  # a directory can't be replaced by the saved file
+save_failed = False
+
+try:
+    bombman.StringSerializable().save_to_file(failing_target)
+except OSError:
+    save_failed = True
+
+assertion("saving over a directory fails", save_failed)
+assertion("failed save leaves no temporary file behind", not os.path.exists(failing_target + ".tmp"))
+os.rmdir(failing_target)
+
 if not skip_render_game:
     print("init game")
     game = bombman.Game()